@@ -2,18 +2,33 @@
 Database configuration and session management for TAIFA-FIALA
 """
 
+import atexit
+from typing import Any, Dict, List
+
+import httpx
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 
 from config.settings import settings
 
 
+# One pooled HTTP/2 connection set shared by the Supabase REST, auth and storage clients,
+# so every table call reuses a warm TLS connection
+supabase_http_client = httpx.Client(
+    http2=True,
+    follow_redirects=True,
+    timeout=httpx.Timeout(120.0),
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+)
+atexit.register(supabase_http_client.close)
+
 # Supabase client for auth and real-time features
 supabase: Client = create_client(
     supabase_url=settings.NEXT_PUBLIC_SUPABASE_URL,
-    supabase_key=settings.SUPABASE_SECRET_KEY
+    supabase_key=settings.SUPABASE_SECRET_KEY,
+    options=ClientOptions(httpx_client=supabase_http_client)
 )
 
 # SQLAlchemy engine for direct database access
@@ -24,9 +39,11 @@ engine = create_engine(
     echo=settings.DEBUG
 )
 
-# Async engine for async operations
+# Async engine for async operations; keeps 10 warm connections and bursts to 30
 async_engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
+    pool_size=10,
+    max_overflow=20,
     pool_pre_ping=True,
     pool_recycle=300,
     echo=settings.DEBUG
@@ -39,11 +56,10 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
-AsyncSessionLocal = sessionmaker(
-    class_=AsyncSession,
-    autocommit=False,
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
     autoflush=False,
-    bind=async_engine
+    expire_on_commit=False
 )
 
 
@@ -68,3 +84,19 @@ async def get_async_db():
 def get_supabase() -> Client:
     """Get Supabase client"""
     return supabase
+
+
+def bulk_insert_innovations(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert many innovation rows in a single request and return the stored rows"""
+    if not rows:
+        return []
+    response = supabase.table('innovations').insert(rows).execute()
+    return response.data
+
+
+def delete_innovations(ids: List[str]) -> List[Dict[str, Any]]:
+    """Delete innovations by ID in a single request and return the removed rows"""
+    if not ids:
+        return []
+    response = supabase.table('innovations').delete().in_('id', ids).execute()
+    return response.data
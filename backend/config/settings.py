@@ -51,6 +51,10 @@ class Settings(BaseSettings):
     PINECONE_INDEX_NAME: str
     PINECONE_INTEGRATED_EMBEDDING: bool
     PINECONE_ENVIRONMENT: str
+    # Store and search vectors in a local on-disk index instead of the Pinecone index
+    USE_LOCAL_VECTOR: bool = False
+    # Directory for persisted query/document embeddings; unset disables the disk cache
+    EMBEDDING_CACHE_DIR: Optional[str] = None
 
     # Email Configuration
     SMTP_TLS: Optional[str] = None
@@ -193,6 +197,9 @@ class DevelopmentSettings(Settings):
     DISABLE_ACADEMIC_SCRAPING: bool = True
     ENABLE_MOCK_DATA: bool = True
     
+    # Reuse embeddings of fixed test queries across local and CI runs
+    EMBEDDING_CACHE_DIR: Optional[str] = ".cache/embeddings"
+
     # Limit batch sizes in development
     MAX_ETL_BATCH_SIZE: int = 5
     MAX_AI_CALLS_PER_MINUTE: int = 2
@@ -5,12 +5,17 @@ Medical and health AI research scraper
 
 import asyncio
 import re
+import threading
+import time
+import xml.parsers.expat
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 
 import aiohttp
-import xmltodict
+from aiolimiter import AsyncLimiter
 from config.settings import settings
 from loguru import logger
 from pydantic import BaseModel
@@ -18,6 +23,138 @@ from services.database_service import DatabaseService
 from services.deduplication_service import DeduplicationService
 
 from services.etl_deduplication import check_and_handle_publication_duplicates
+from services.unified_cache import unified_cache, cache_api_response, get_cached_response, DataSource
+
+try:
+    import hyperscan
+except ImportError:
+    logger.debug("hyperscan not installed - using substring keyword matching")
+    hyperscan = None
+
+
+# Relevance keywords (lowercase, matched as substrings of title + abstract).
+# Frozen so scorers can intersect match sets with them without rebuilding
+AFRICAN_KEYWORDS = frozenset([
+    "africa", "african", "nigeria", "kenya", "south africa", "ghana",
+    "ethiopia", "tanzania", "uganda", "rwanda", "botswana", "zambia",
+    "zimbabwe", "morocco", "egypt", "tunisia", "senegal", "mali",
+    "burkina faso", "sub-saharan", "west africa", "east africa",
+    "southern africa", "north africa"
+])
+
+AI_KEYWORDS = frozenset([
+    "artificial intelligence", "machine learning", "deep learning",
+    "neural network", "computer vision", "natural language processing",
+    "ai", "ml", "nlp", "cnn", "rnn", "lstm", "transformer",
+    "classification", "prediction", "algorithm", "automated"
+])
+
+HIGH_VALUE_AI_KEYWORDS = frozenset(["artificial intelligence", "machine learning", "deep learning"])
+
+
+# Search terms, OR-joined per topic and AND-ed into one query at import
+SEARCH_AI_TERMS = (
+    "artificial intelligence", "machine learning", "deep learning", "AI", "ML",
+    "neural network", "computer vision", "natural language processing"
+)
+
+SEARCH_AFRICAN_TERMS = (
+    "Africa", "African", "Nigeria", "Kenya", "South Africa",
+    "Ghana", "Ethiopia", "Tanzania", "Uganda", "Rwanda",
+    "Botswana", "Zambia", "Zimbabwe", "Morocco", "Egypt",
+    "Tunisia", "Senegal", "Mali", "Burkina Faso"
+)
+
+SEARCH_HEALTH_TERMS = (
+    "health", "healthcare", "medical", "medicine", "clinical",
+    "disease", "diagnosis", "treatment", "public health",
+    "epidemiology", "telemedicine", "digital health",
+    "mobile health", "mHealth", "eHealth"
+)
+
+SEARCH_QUERY = " AND ".join(
+    "(" + " OR ".join(f'"{term}"' for term in terms) + ")"
+    for terms in (SEARCH_AI_TERMS, SEARCH_AFRICAN_TERMS, SEARCH_HEALTH_TERMS)
+)
+
+# PubMed abbreviated month names
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
+    "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
+    "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+
+# Every relevance keyword, deduplicated, so a paper's text is scanned once
+_ALL_KEYWORDS = tuple(sorted(AFRICAN_KEYWORDS | AI_KEYWORDS))
+
+
+def _compile_keyword_database():
+    """Compile all relevance keywords into a single Hyperscan database"""
+    if hyperscan is None:
+        return None
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(keyword).encode() for keyword in _ALL_KEYWORDS],
+            ids=list(range(len(_ALL_KEYWORDS))),
+            elements=len(_ALL_KEYWORDS),
+            # Report each keyword once; a match set is all the scorers need.
+            # Caseless matching saves lowercasing every paper's text first
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_CASELESS] * len(_ALL_KEYWORDS)
+        )
+        return database
+    except Exception as e:
+        logger.warning(f"Could not compile hyperscan keyword database: {e}")
+        return None
+
+
+_KEYWORD_DATABASE = _compile_keyword_database()
+
+# A hyperscan scratch space serves one scan at a time, and match_keywords runs on
+# worker threads for concurrently gathered batches, so each thread keeps its own
+_scratch_local = threading.local()
+
+
+def _thread_scratch():
+    scratch = getattr(_scratch_local, "scratch", None)
+    if scratch is None:
+        scratch = _scratch_local.scratch = hyperscan.Scratch(_KEYWORD_DATABASE)
+    return scratch
+
+
+def _generate_substring_matcher():
+    """Generate a straight-line `in` check per keyword for when hyperscan is unavailable
+    
+    The keyword tables are fixed at import, so unrolling them avoids the
+    per-keyword loop and tuple indexing of a generic scan.
+    """
+    source = "def _match_substrings(text):\n    text = text.lower()\n    found = set()\n"
+    source += "".join(
+        f"    if {keyword!r} in text: found.add({keyword!r})\n" for keyword in _ALL_KEYWORDS
+    )
+    source += "    return found\n"
+    
+    namespace = {}
+    exec(compile(source, "<pubmed keyword matcher>", "exec"), namespace)
+    return namespace["_match_substrings"]
+
+
+_match_substrings = _generate_substring_matcher()
+
+
+def match_keywords(text: str) -> set:
+    """Return every relevance keyword occurring in text, ignoring case"""
+    if _KEYWORD_DATABASE is None:
+        return _match_substrings(text)
+    
+    found = set()
+    
+    def on_match(keyword_id, start, end, flags, context):
+        found.add(_ALL_KEYWORDS[keyword_id])
+    
+    _KEYWORD_DATABASE.scan(text.encode(), match_event_handler=on_match, scratch=_thread_scratch())
+    return found
 
 
 class PubMedPaper(BaseModel):
@@ -34,22 +171,225 @@ class PubMedPaper(BaseModel):
     mesh_terms: List[str] = []
     african_relevance_score: float = 0.0
     ai_relevance_score: float = 0.0
+    african_entities: List[str] = []
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit adjusted by AIMD: halve on throttling, creep up on fast successes"""
+    
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 10, target_latency: float = 2.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self.latencies = deque(maxlen=32)
+        self.paused_until = 0.0
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        
+        # While the circuit is open after throttling, hold new requests back
+        delay = self.paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+    
+    def record_success(self, latency: float):
+        """Additively increase the limit while average latency stays under target"""
+        self.latencies.append(latency)
+        if sum(self.latencies) / len(self.latencies) < self.target_latency:
+            self.limit = min(self.maximum, self.limit + 0.5)
+    
+    def record_throttled(self, retry_after: float):
+        """Multiplicatively decrease the limit and pause every request for retry_after"""
+        self.limit = max(self.minimum, self.limit * 0.5)
+        self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+
+class PubMedXMLParser:
+    """Incremental expat parser emitting one flat record per PubmedArticle
+    
+    Only the elements listed in FIELD_PATHS are captured, and subtrees that
+    cannot contain one (reference lists, affiliations, grants...) are skipped
+    by depth counting alone. Text is collected across inline markup (e.g. <i>
+    in titles) rather than dropped.
+    """
+    
+    # Element path below PubmedArticle -> record field
+    FIELD_PATHS = {
+        ("MedlineCitation", "PMID"): "pmid",
+        ("MedlineCitation", "Article", "ArticleTitle"): "title",
+        ("MedlineCitation", "Article", "Abstract", "AbstractText"): "abstract",
+        ("MedlineCitation", "Article", "AuthorList", "Author", "ForeName"): "ForeName",
+        ("MedlineCitation", "Article", "AuthorList", "Author", "LastName"): "LastName",
+        ("MedlineCitation", "Article", "Journal", "Title"): "journal",
+        ("MedlineCitation", "Article", "Journal", "ISOAbbreviation"): "iso_abbreviation",
+        ("MedlineCitation", "Article", "Journal", "JournalIssue", "PubDate", "Year"): "Year",
+        ("MedlineCitation", "Article", "Journal", "JournalIssue", "PubDate", "Month"): "Month",
+        ("MedlineCitation", "Article", "Journal", "JournalIssue", "PubDate", "Day"): "Day",
+        ("MedlineCitation", "MeshHeadingList", "MeshHeading", "DescriptorName"): "mesh_terms",
+        ("MedlineCitation", "KeywordList", "Keyword"): "keywords",
+        ("PubmedData", "ArticleIdList", "ArticleId"): "doi",
+    }
+    AUTHOR_PATH = ("MedlineCitation", "Article", "AuthorList", "Author")
+    # Every path on the way to a captured field; anything else is pruned
+    CAPTURE_PREFIXES = frozenset(
+        path[:i] for path in list(FIELD_PATHS) for i in range(1, len(path) + 1)
+    )
+    
+    def __init__(self):
+        self._records = []
+        self._path = []
+        self._skip_depth = 0
+        self._record = None
+        self._author = None
+        self._field = None
+        self._field_depth = 0
+        self._text = []
+        
+        self._parser = xml.parsers.expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._char_data
+    
+    def feed(self, data: bytes, final: bool = False):
+        """Parse the next chunk of the document"""
+        self._parser.Parse(data, final)
+    
+    def drain(self) -> List[Dict[str, Any]]:
+        """Return and clear the records completed so far"""
+        records, self._records = self._records, []
+        return records
+    
+    def _start(self, name: str, attrs: Dict[str, str]):
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+        
+        self._path.append(name)
+        
+        if self._record is None:
+            if name == "PubmedArticle" and len(self._path) == 2:
+                self._record = {
+                    "pmid": "", "title": "", "abstract": [], "authors": [],
+                    "journal": "", "iso_abbreviation": "", "pub_date": {},
+                    "doi": None, "mesh_terms": [], "keywords": []
+                }
+            return
+        
+        # Inline markup inside a captured field just contributes its text
+        if self._field is not None:
+            return
+        
+        path = tuple(self._path[2:])
+        if path not in self.CAPTURE_PREFIXES:
+            self._path.pop()
+            self._skip_depth = 1
+            return
+        
+        if path == self.AUTHOR_PATH:
+            self._author = {}
+            return
+        
+        field = self.FIELD_PATHS.get(path)
+        if field is None or (field == "doi" and attrs.get("IdType") != "doi"):
+            return
+        
+        self._field = field
+        self._field_depth = len(self._path)
+        self._text = []
+    
+    def _end(self, name: str):
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        
+        if self._field is not None and len(self._path) == self._field_depth:
+            self._store(self._field, "".join(self._text).strip())
+            self._field = None
+        elif self._author is not None and tuple(self._path[2:]) == self.AUTHOR_PATH:
+            self._record["authors"].append((self._author.get("ForeName", ""), self._author.get("LastName", "")))
+            self._author = None
+        elif self._record is not None and len(self._path) == 2:
+            self._records.append(self._record)
+            self._record = None
+        
+        self._path.pop()
+    
+    def _char_data(self, data: str):
+        if self._field is not None:
+            self._text.append(data)
+    
+    def _store(self, field: str, text: str):
+        record = self._record
+        if field in ("abstract", "mesh_terms", "keywords"):
+            if text or field == "abstract":
+                record[field].append(text)
+        elif field in ("ForeName", "LastName"):
+            self._author[field] = text
+        elif field in ("Year", "Month", "Day"):
+            record["pub_date"][field] = text
+        elif field == "doi":
+            if record["doi"] is None:
+                record["doi"] = text
+        elif not record[field]:
+            record[field] = text
 
 
 class PubMedScraper:
     """PubMed API scraper for African health AI research"""
     
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    MAX_CONCURRENT_REQUESTS = 3
+    # NCBI allows 3 requests/second without an API key and 10 with one;
+    # stay just under the keyed ceiling
+    REQUESTS_PER_SECOND = 3
+    REQUESTS_PER_SECOND_WITH_KEY = 9
+    RETRY_STATUSES = {429, 502, 503}
+    MAX_RETRIES = 3
+    EFETCH_CACHE_TTL_HOURS = 24 * 7  # Published records rarely change
+    STREAM_CHUNK_SIZE = 64 * 1024
+    # Papers must score above both thresholds to be kept
+    MIN_AFRICAN_RELEVANCE = 0.3
+    MIN_AI_RELEVANCE = 0.4
     
     def __init__(self):
         self.session = None
+        self.api_key = settings.PUBMED_API_KEY
+        
+        # Token bucket shared by every E-utilities call this scraper makes
+        rate = self.REQUESTS_PER_SECOND_WITH_KEY if self.api_key else self.REQUESTS_PER_SECOND
+        self.limiter = AsyncLimiter(rate, 1)
+        self.concurrency = AdaptiveConcurrencyLimiter(self.MAX_CONCURRENT_REQUESTS, maximum=rate)
         
         # Initialize database and deduplication services
         self.db_service = DatabaseService()
         self.dedup_service = DeduplicationService()
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # One pooled connector for the scraper's lifetime so every E-utilities
+        # call reuses a warm keep-alive connection to NCBI
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, sock_read=15)
+        )
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -59,46 +399,15 @@ class PubMedScraper:
     async def search_african_health_ai(self, days_back: int = 30, max_results: int = 50) -> List[PubMedPaper]:
         """Search PubMed for African health AI papers"""
         
-        # Construct search query targeting African health + AI
-        search_terms = [
-            "artificial intelligence",
-            "machine learning", 
-            "deep learning",
-            "AI",
-            "ML",
-            "neural network",
-            "computer vision",
-            "natural language processing"
-        ]
-        
-        african_terms = [
-            "Africa", "African", "Nigeria", "Kenya", "South Africa", 
-            "Ghana", "Ethiopia", "Tanzania", "Uganda", "Rwanda",
-            "Botswana", "Zambia", "Zimbabwe", "Morocco", "Egypt",
-            "Tunisia", "Senegal", "Mali", "Burkina Faso"
-        ]
-        
-        health_terms = [
-            "health", "healthcare", "medical", "medicine", "clinical",
-            "disease", "diagnosis", "treatment", "public health",
-            "epidemiology", "telemedicine", "digital health",
-            "mobile health", "mHealth", "eHealth"
-        ]
-        
-        # Build sophisticated query
-        ai_query = "(" + " OR ".join([f'"{term}"' for term in search_terms]) + ")"
-        africa_query = "(" + " OR ".join([f'"{term}"' for term in african_terms]) + ")"
-        health_query = "(" + " OR ".join([f'"{term}"' for term in health_terms]) + ")"
-        
-        # Combine with date filter
+        # Restrict the prebuilt African health + AI query to recent publications
         date_filter = (datetime.now() - timedelta(days=days_back)).strftime("%Y/%m/%d")
         
-        full_query = f"{ai_query} AND {africa_query} AND {health_query} AND (\"{date_filter}\"[Date - Publication] : \"3000\"[Date - Publication])"
+        full_query = f"{SEARCH_QUERY} AND (\"{date_filter}\"[Date - Publication] : \"3000\"[Date - Publication])"
         
         logger.info(f"Searching PubMed with query: {full_query[:100]}...")
         
-        # Search for PMIDs
-        pmids = await self._search_pmids(full_query, max_results)
+        # Search for PMIDs, keeping the result set on the history server
+        pmids, history = await self._search_pmids(full_query, max_results)
         
         if not pmids:
             logger.info("No PMIDs found")
@@ -106,30 +415,24 @@ class PubMedScraper:
             
         logger.info(f"Found {len(pmids)} PMIDs, fetching details...")
         
-        # Fetch paper details
-        papers = await self._fetch_paper_details(pmids)
+        # Fetch details of the papers with reasonable African and AI relevance
+        papers = await self._fetch_paper_details(pmids, history)
         
-        # Score for African and AI relevance
-        scored_papers = []
+        # Keep one copy per PMID
+        relevant = {}
         for paper in papers:
-            paper.african_relevance_score = self._calculate_african_relevance(paper)
-            paper.ai_relevance_score = self._calculate_ai_relevance(paper)
-            
-            # Only include papers with reasonable relevance
-            if paper.african_relevance_score > 0.3 and paper.ai_relevance_score > 0.4:
-                scored_papers.append(paper)
-        
-        # Sort by combined relevance score
-        scored_papers.sort(
-            key=lambda p: p.african_relevance_score + p.ai_relevance_score, 
-            reverse=True
-        )
+            if paper.pmid not in relevant:
+                relevant[paper.pmid] = (paper.african_relevance_score + paper.ai_relevance_score, paper)
+        
+        # Sort by combined relevance score, computed once per paper above
+        ranked = sorted(relevant.values(), key=itemgetter(0), reverse=True)
+        scored_papers = [paper for _, paper in ranked]
         
         logger.info(f"Filtered to {len(scored_papers)} highly relevant papers")
         return scored_papers
 
-    async def _search_pmids(self, query: str, max_results: int) -> List[str]:
-        """Search PubMed for PMIDs"""
+    async def _search_pmids(self, query: str, max_results: int) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """Search PubMed for PMIDs and the history-server key for the result set"""
         search_url = f"{self.BASE_URL}/esearch.fcgi"
         
         params = {
@@ -138,264 +441,249 @@ class PubMedScraper:
             "retmax": max_results,
             "retmode": "json",
             "sort": "pub_date",
+            "usehistory": "y",
             "tool": "taifa-fiala",
             "email": "research@taifa-fiala.org"  # Required by PubMed
         }
+        if self.api_key:
+            params["api_key"] = self.api_key
         
         try:
-            async with self.session.get(search_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("esearchresult", {}).get("idlist", [])
-                else:
-                    logger.error(f"PubMed search failed: {response.status}")
-                    return []
+            # POST so long OR-joined queries are not bound by URL length limits
+            data = await self._post(search_url, params, lambda response: response.json())
+            if data is None:
+                return [], None
+            
+            result = data.get("esearchresult", {})
+            
+            history = None
+            if result.get("webenv") and result.get("querykey"):
+                history = {"WebEnv": result["webenv"], "query_key": result["querykey"]}
+            
+            return result.get("idlist", []), history
                     
         except Exception as e:
             logger.error(f"Error searching PubMed: {e}")
-            return []
+            return [], None
 
-    async def _fetch_paper_details(self, pmids: List[str]) -> List[PubMedPaper]:
+    async def _fetch_paper_details(self, pmids: List[str], history: Optional[Dict[str, str]] = None) -> List[PubMedPaper]:
         """Fetch detailed paper information"""
         if not pmids:
             return []
-            
-        fetch_url = f"{self.BASE_URL}/efetch.fcgi"
         
         # Process in batches to avoid overwhelming the API
         batch_size = 20
-        all_papers = []
         
-        for i in range(0, len(pmids), batch_size):
-            batch_pmids = pmids[i:i + batch_size]
-            
-            params = {
-                "db": "pubmed",
-                "id": ",".join(batch_pmids),
-                "retmode": "xml",
-                "tool": "taifa-fiala",
-                "email": "research@taifa-fiala.org"
-            }
-            
-            try:
-                await asyncio.sleep(0.5)  # Respectful rate limiting
-                
-                async with self.session.get(fetch_url, params=params) as response:
-                    if response.status == 200:
-                        xml_content = await response.text()
-                        papers = self._parse_pubmed_xml(xml_content)
-                        all_papers.extend(papers)
-                    else:
-                        logger.error(f"PubMed fetch failed: {response.status}")
-                        
-            except Exception as e:
-                logger.error(f"Error fetching PubMed batch: {e}")
-                continue
+        # Fetch batches concurrently; _post bounds how many are in flight. The
+        # batches' cache lookups all share the Redis client held open here
+        async with unified_cache:
+            batches = await asyncio.gather(*[
+                self._fetch_batch(pmids[i:i + batch_size], history, i)
+                for i in range(0, len(pmids), batch_size)
+            ])
+        
+        all_papers = []
+        for papers in batches:
+            all_papers.extend(papers)
                 
         return all_papers
 
-    def _parse_pubmed_xml(self, xml_content: str) -> List[PubMedPaper]:
-        """Parse PubMed XML response"""
-        papers = []
+    async def _fetch_batch(
+        self,
+        batch_pmids: List[str],
+        history: Optional[Dict[str, str]] = None,
+        retstart: int = 0
+    ) -> List[PubMedPaper]:
+        """Fetch a single batch of PMIDs from efetch"""
+        fetch_url = f"{self.BASE_URL}/efetch.fcgi"
+        
+        params = {
+            "db": "pubmed",
+            "retmode": "xml",
+            "tool": "taifa-fiala",
+            "email": "research@taifa-fiala.org"
+        }
+        if self.api_key:
+            params["api_key"] = self.api_key
+        
+        if history:
+            # Page through the stored search result instead of resending PMIDs
+            params.update(history)
+            params["retstart"] = retstart
+            params["retmax"] = len(batch_pmids)
+        else:
+            params["id"] = ",".join(batch_pmids)
         
+        # Cache the parsed records on the PMIDs themselves (sorted by the cache) so
+        # identical batches hit regardless of order or which search produced them
+        cache_params = {"endpoint": "efetch", "pmids": batch_pmids}
         try:
-            data = xmltodict.parse(xml_content)
-            articles = data.get("PubmedArticleSet", {}).get("PubmedArticle", [])
-            
-            # Handle single article case
-            if isinstance(articles, dict):
-                articles = [articles]
-                
-            for article in articles:
+            cached_records = await get_cached_response(DataSource.PUBMED_API, cache_params)
+            if isinstance(cached_records, list):
+                logger.debug(f"Using cached PubMed efetch for {len(batch_pmids)} PMIDs")
+                return await asyncio.to_thread(self._build_papers, cached_records)
+        except Exception as e:
+            logger.warning(f"Error checking PubMed cache: {e}")
+        
+        try:
+            records = await self._post(fetch_url, params, self._read_articles)
+            if records is not None:
                 try:
-                    paper = self._extract_paper_data(article)
-                    if paper:
-                        papers.append(paper)
+                    await cache_api_response(DataSource.PUBMED_API, cache_params,
+                                           records, self.EFETCH_CACHE_TTL_HOURS)
                 except Exception as e:
-                    logger.warning(f"Error parsing paper: {e}")
-                    continue
+                    logger.warning(f"Error caching PubMed efetch response: {e}")
+                # Score off the event loop so other batches keep downloading
+                return await asyncio.to_thread(self._build_papers, records)
                     
         except Exception as e:
-            logger.error(f"Error parsing PubMed XML: {e}")
+            logger.error(f"Error fetching PubMed batch: {e}")
             
-        return papers
+        return []
 
-    def _extract_paper_data(self, article: Dict) -> Optional[PubMedPaper]:
-        """Extract paper data from PubMed XML structure"""
-        try:
-            medline_citation = article.get("MedlineCitation", {})
-            pubmed_data = article.get("PubmedData", {})
-            
-            # PMID
-            pmid = medline_citation.get("PMID", {}).get("#text", "")
+    async def _post(self, url: str, params: Dict[str, Any], read: Callable[[aiohttp.ClientResponse], Awaitable[Any]]) -> Any:
+        """POST to an E-utilities endpoint, backing off and retrying when throttled"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with self.concurrency, self.limiter:
+                start = time.monotonic()
+                async with self.session.post(url, data=params) as response:
+                    if response.status == 200:
+                        body = await read(response)
+                        self.concurrency.record_success(time.monotonic() - start)
+                        return body
+                    
+                    if response.status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                        logger.error(f"PubMed request to {url} failed: {response.status}")
+                        return None
+                    
+                    try:
+                        retry_after = float(response.headers.get("Retry-After", 2 ** attempt))
+                    except ValueError:
+                        retry_after = 2 ** attempt
+                    
+                    self.concurrency.record_throttled(retry_after)
+                    logger.warning(
+                        f"PubMed throttled ({response.status}), retrying in {retry_after:.1f}s "
+                        f"with concurrency {int(self.concurrency.limit)}"
+                    )
+        
+        return None
+
+    async def _read_articles(self, response: aiohttp.ClientResponse) -> List[Dict[str, Any]]:
+        """Stream an efetch body through the XML parser as it downloads"""
+        parser = PubMedXMLParser()
+        
+        # Each chunk is parsed off the event loop; the full body is never buffered
+        async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+            await asyncio.to_thread(parser.feed, chunk)
+        parser.feed(b"", final=True)
+        
+        return parser.drain()
+
+    def _build_papers(self, records: List[Dict[str, Any]]) -> List[PubMedPaper]:
+        """Build and score the papers relevant enough to keep from parsed article records"""
+        papers = []
+        
+        for record in records:
+            # Score the raw record first so irrelevant papers are never built
+            relevance = self._score_relevance(f"{record['title']} {' '.join(record['abstract'])}")
+            if relevance is None:
+                continue
             
-            # Article details
-            article_data = medline_citation.get("Article", {})
+            try:
+                paper = self._extract_paper_data(record)
+            except Exception as e:
+                logger.warning(f"Error parsing paper: {e}")
+                continue
+            if not paper:
+                continue
             
-            # Title
-            title = article_data.get("ArticleTitle", "")
-            if isinstance(title, dict):
-                title = title.get("#text", "")
-                
-            # Abstract
-            abstract_data = article_data.get("Abstract", {})
-            abstract_text = ""
-            if abstract_data:
-                abstract_parts = abstract_data.get("AbstractText", [])
-                if isinstance(abstract_parts, list):
-                    abstract_text = " ".join([
-                        part.get("#text", "") if isinstance(part, dict) else str(part)
-                        for part in abstract_parts
-                    ])
-                elif isinstance(abstract_parts, dict):
-                    abstract_text = abstract_parts.get("#text", "")
-                else:
-                    abstract_text = str(abstract_parts)
+            paper.african_relevance_score, paper.ai_relevance_score, paper.african_entities = relevance
+            papers.append(paper)
+        
+        return papers
+
+    def _score_relevance(self, text: str) -> Optional[Tuple[float, float, List[str]]]:
+        """Score African and AI relevance from a single scan, or None below either threshold"""
+        found_keywords = match_keywords(text)
+        
+        african_score, african_entities = self._calculate_african_relevance(found_keywords)
+        if african_score <= self.MIN_AFRICAN_RELEVANCE:
+            return None
+        
+        ai_score = self._calculate_ai_relevance(found_keywords)
+        if ai_score <= self.MIN_AI_RELEVANCE:
+            return None
+        
+        return african_score, ai_score, african_entities
+
+    def _extract_paper_data(self, record: Dict[str, Any]) -> Optional[PubMedPaper]:
+        """Build a paper from a flat record emitted by PubMedXMLParser"""
+        try:
+            pmid = record["pmid"]
             
-            # Authors
             authors = []
-            author_list = article_data.get("AuthorList", {}).get("Author", [])
-            if isinstance(author_list, dict):
-                author_list = [author_list]
-                
-            for author in author_list:
-                if isinstance(author, dict):
-                    first_name = author.get("ForeName", "")
-                    last_name = author.get("LastName", "")
-                    if first_name and last_name:
-                        authors.append(f"{first_name} {last_name}")
-                    elif last_name:
-                        authors.append(last_name)
-            
-            # Journal
-            journal_data = article_data.get("Journal", {})
-            journal = journal_data.get("Title", "") or journal_data.get("ISOAbbreviation", "")
-            
-            # Publication date
-            pub_date_data = journal_data.get("JournalIssue", {}).get("PubDate", {})
-            pub_date = self._parse_publication_date(pub_date_data)
-            
-            # DOI
-            doi = None
-            article_ids = pubmed_data.get("ArticleIdList", {}).get("ArticleId", [])
-            if isinstance(article_ids, dict):
-                article_ids = [article_ids]
-                
-            for article_id in article_ids:
-                if isinstance(article_id, dict) and article_id.get("@IdType") == "doi":
-                    doi = article_id.get("#text")
-                    break
-            
-            # MeSH terms
-            mesh_terms = []
-            mesh_list = medline_citation.get("MeshHeadingList", {}).get("MeshHeading", [])
-            if isinstance(mesh_list, dict):
-                mesh_list = [mesh_list]
-                
-            for mesh in mesh_list:
-                if isinstance(mesh, dict):
-                    descriptor = mesh.get("DescriptorName", {})
-                    if isinstance(descriptor, dict):
-                        term = descriptor.get("#text", "")
-                        if term:
-                            mesh_terms.append(term)
-            
-            # Keywords
-            keywords = []
-            keyword_list = medline_citation.get("KeywordList", {}).get("Keyword", [])
-            if isinstance(keyword_list, dict):
-                keyword_list = [keyword_list]
-                
-            for keyword in keyword_list:
-                if isinstance(keyword, dict):
-                    keyword_text = keyword.get("#text", "")
-                    if keyword_text:
-                        keywords.append(keyword_text)
-                elif isinstance(keyword, str):
-                    keywords.append(keyword)
-            
-            # URL
-            url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
+            for first_name, last_name in record["authors"]:
+                if first_name and last_name:
+                    authors.append(f"{first_name} {last_name}")
+                elif last_name:
+                    authors.append(last_name)
             
             return PubMedPaper(
                 pmid=pmid,
-                title=title,
+                title=record["title"],
                 authors=authors,
-                abstract=abstract_text,
-                journal=journal,
-                publication_date=pub_date,
-                doi=doi,
-                url=url,
-                keywords=keywords,
-                mesh_terms=mesh_terms
+                abstract=" ".join(record["abstract"]),
+                journal=record["journal"] or record["iso_abbreviation"],
+                publication_date=self._parse_publication_date(record["pub_date"]),
+                doi=record["doi"],
+                url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+                keywords=record["keywords"],
+                mesh_terms=record["mesh_terms"]
             )
             
         except Exception as e:
             logger.error(f"Error extracting paper data: {e}")
             return None
 
-    def _parse_publication_date(self, pub_date_data: Dict) -> datetime:
+    def _parse_publication_date(self, pub_date_data: Dict[str, str]) -> datetime:
         """Parse publication date from various PubMed formats"""
+        year = pub_date_data.get("Year", "")
+        month = pub_date_data.get("Month", "")
+        day = pub_date_data.get("Day", "")
+        
+        # Months arrive either numeric ("03") or abbreviated ("Mar")
+        month = int(month) if month.isdigit() else _MONTHS.get(month[:3], 1)
+        
         try:
-            year = pub_date_data.get("Year", datetime.now().year)
-            month = pub_date_data.get("Month", 1)
-            day = pub_date_data.get("Day", 1)
-            
-            # Handle month names
-            if isinstance(month, str):
-                month_map = {
-                    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
-                    "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
-                    "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
-                }
-                month = month_map.get(month[:3], 1)
-            
-            return datetime(int(year), int(month), int(day))
-            
-        except Exception:
+            return datetime(
+                int(year) if year.isdigit() else datetime.now().year,
+                month,
+                int(day) if day.isdigit() else 1
+            )
+        except ValueError:
             return datetime.now()
 
-    def _calculate_african_relevance(self, paper: PubMedPaper) -> float:
-        """Calculate African relevance score"""
-        african_keywords = [
-            "africa", "african", "nigeria", "kenya", "south africa", "ghana",
-            "ethiopia", "tanzania", "uganda", "rwanda", "botswana", "zambia",
-            "zimbabwe", "morocco", "egypt", "tunisia", "senegal", "mali",
-            "burkina faso", "sub-saharan", "west africa", "east africa",
-            "southern africa", "north africa"
-        ]
-        
-        text = f"{paper.title} {paper.abstract}".lower()
+    def _calculate_african_relevance(self, found_keywords: set) -> Tuple[float, List[str]]:
+        """Calculate African relevance score and the African entities found in a paper"""
+        found_entities = found_keywords & AFRICAN_KEYWORDS
+        matches = len(found_entities)
         
-        score = 0.0
-        for keyword in african_keywords:
-            if keyword in text:
-                score += 0.2
+        score = matches * 0.2
                 
         # Boost for specific African countries/regions
-        country_mentions = len([k for k in african_keywords if k in text])
-        score += min(country_mentions * 0.1, 0.5)
+        score += min(matches * 0.1, 0.5)
         
-        return min(score, 1.0)
+        return min(score, 1.0), sorted(found_entities)
 
-    def _calculate_ai_relevance(self, paper: PubMedPaper) -> float:
-        """Calculate AI relevance score"""
-        ai_keywords = [
-            "artificial intelligence", "machine learning", "deep learning",
-            "neural network", "computer vision", "natural language processing",
-            "ai", "ml", "nlp", "cnn", "rnn", "lstm", "transformer",
-            "classification", "prediction", "algorithm", "automated"
-        ]
-        
-        text = f"{paper.title} {paper.abstract}".lower()
-        
+    def _calculate_ai_relevance(self, found_keywords: set) -> float:
+        """Calculate AI relevance score from the keywords found in a paper"""
         score = 0.0
-        for keyword in ai_keywords:
-            if keyword in text:
-                if keyword in ["artificial intelligence", "machine learning", "deep learning"]:
-                    score += 0.3  # High-value terms
-                else:
-                    score += 0.1
+        for keyword in found_keywords & AI_KEYWORDS:
+            if keyword in HIGH_VALUE_AI_KEYWORDS:
+                score += 0.3  # High-value terms
+            else:
+                score += 0.1
                     
         return min(score, 1.0)
     
@@ -418,7 +706,7 @@ class PubMedScraper:
                     'abstract': paper.abstract,
                     'keywords': paper.keywords,
                     'source': 'pubmed',
-                    'source_id': paper.pubmed_id,
+                    'source_id': paper.pmid,
                     'african_relevance_score': paper.african_relevance_score,
                     'ai_relevance_score': paper.ai_relevance_score,
                     'african_entities': paper.african_entities,
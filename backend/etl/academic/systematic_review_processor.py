@@ -16,6 +16,9 @@ from services.deduplication_service import DeduplicationService
 
 from services.etl_deduplication import check_and_handle_publication_duplicates
 
+# Compiled once; parse_year runs for every row of the review export
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+
 
 class SystematicReviewProcessor:
     """Process systematic review data from CSV export"""
@@ -163,7 +166,7 @@ class SystematicReviewProcessor:
                 return None
             
             # Extract 4-digit year
-            year_match = re.search(r'\b(19|20)\d{2}\b', year_str)
+            year_match = _YEAR_RE.search(year_str)
             if year_match:
                 year = int(year_match.group())
                 if 1990 <= year <= 2030:  # Reasonable range
@@ -7,6 +7,8 @@ Creates a comprehensive dataset for the public innovation portal
 
 import asyncio
 import json
+import re
+from collections import Counter
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from loguru import logger
@@ -17,6 +19,11 @@ from .pubmed_scraper import PubMedScraper
 from .systematic_review_processor import SystematicReviewProcessor
 # Note: Google Scholar scraper to be integrated when available
 
+# Title normalization patterns, compiled once for every paper deduplicated
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_STOPWORD_RE = re.compile(r'\b(the|a|an|and|or|but|in|on|at|to|for|of|with|by)\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class UnifiedAcademicProcessor:
     """Unified processor combining all academic data sources"""
@@ -231,14 +238,12 @@ class UnifiedAcademicProcessor:
     
     def normalize_title_for_dedup(self, title: str) -> str:
         """Normalize title for deduplication"""
-        import re
-        
         # Convert to lowercase and remove special characters
-        normalized = re.sub(r'[^\w\s]', '', title.lower())
+        normalized = _NON_WORD_RE.sub('', title.lower())
         
         # Remove common words and extra spaces
-        normalized = re.sub(r'\b(the|a|an|and|or|but|in|on|at|to|for|of|with|by)\b', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = _STOPWORD_RE.sub('', normalized)
+        normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
         
         return normalized
     
@@ -268,60 +273,71 @@ class UnifiedAcademicProcessor:
         
         total_papers = len(self.all_papers)
         
-        # Source distribution
-        source_dist = {}
+        source_dist = Counter()
+        year_dist = Counter()
+        domain_dist = Counter()
+        geo_dist = Counter()
+        keyword_dist = Counter()
+        african_total = african_count = 0
+        ai_total = ai_count = 0
+        citation_total = citation_count = 0
+        high_relevance_papers = 0
+        recent_papers = 0
+        
+        # Every distribution and average is gathered in a single pass over the dataset
         for paper in self.all_papers:
+            # Source distribution
             source = paper['source']
-            source_dist[source] = source_dist.get(source, 0) + 1
-        
-        # Year distribution
-        year_dist = {}
-        for paper in self.all_papers:
+            source_dist[source] += 1
+            
+            # Year distribution
             year = paper.get('year')
             if year:
-                year_dist[year] = year_dist.get(year, 0) + 1
-        
-        # Domain distribution (from systematic review data)
-        domain_dist = {}
-        for paper in self.all_papers:
+                year_dist[year] += 1
+                if year >= 2020:
+                    recent_papers += 1
+            
+            # Domain distribution (from systematic review data)
             domain = paper.get('project_domain', '')
             if domain and domain != 'nan':
                 # Clean domain
                 domain = domain.split('\n')[0].strip('- ').strip()
                 if domain and len(domain) > 3:
-                    domain_dist[domain] = domain_dist.get(domain, 0) + 1
-        
-        # Geographic distribution
-        geo_dist = {}
-        for paper in self.all_papers:
-            for entity in paper.get('african_entities', []):
-                geo_dist[entity] = geo_dist.get(entity, 0) + 1
-        
-        # Keywords distribution
-        keyword_dist = {}
-        for paper in self.all_papers:
-            for keyword in paper.get('keywords', []):
-                keyword_dist[keyword] = keyword_dist.get(keyword, 0) + 1
-        
-        # Relevance scores
-        african_scores = [p['african_relevance_score'] for p in self.all_papers if p['african_relevance_score'] > 0]
-        ai_scores = [p['ai_relevance_score'] for p in self.all_papers if p['ai_relevance_score'] > 0]
-        citations = [p['citation_count'] for p in self.all_papers if p['citation_count'] > 0]
+                    domain_dist[domain] += 1
+            
+            # Geographic distribution
+            geo_dist.update(paper.get('african_entities', []))
+            
+            # Keywords distribution
+            keyword_dist.update(paper.get('keywords', []))
+            
+            # Relevance scores
+            african_score = paper['african_relevance_score']
+            ai_score = paper['ai_relevance_score']
+            if african_score > 0:
+                african_total += african_score
+                african_count += 1
+            if ai_score > 0:
+                ai_total += ai_score
+                ai_count += 1
+            if paper['citation_count'] > 0:
+                citation_total += paper['citation_count']
+                citation_count += 1
+            if african_score >= 0.5 and ai_score >= 0.3:
+                high_relevance_papers += 1
         
         return {
             'total_papers': total_papers,
-            'source_distribution': dict(sorted(source_dist.items(), key=lambda x: x[1], reverse=True)),
+            'source_distribution': dict(source_dist.most_common()),
             'year_distribution': dict(sorted(year_dist.items(), reverse=True)),
-            'top_domains': dict(list(sorted(domain_dist.items(), key=lambda x: x[1], reverse=True))[:10]),
-            'top_african_entities': dict(list(sorted(geo_dist.items(), key=lambda x: x[1], reverse=True))[:15]),
-            'top_keywords': dict(list(sorted(keyword_dist.items(), key=lambda x: x[1], reverse=True))[:15]),
-            'avg_african_relevance': sum(african_scores) / len(african_scores) if african_scores else 0,
-            'avg_ai_relevance': sum(ai_scores) / len(ai_scores) if ai_scores else 0,
-            'avg_citations': sum(citations) / len(citations) if citations else 0,
-            'high_relevance_papers': len([p for p in self.all_papers 
-                                        if p['african_relevance_score'] >= 0.5 and p['ai_relevance_score'] >= 0.3]),
-            'recent_papers': len([p for p in self.all_papers 
-                                if p.get('year', 0) >= 2020])
+            'top_domains': dict(domain_dist.most_common(10)),
+            'top_african_entities': dict(geo_dist.most_common(15)),
+            'top_keywords': dict(keyword_dist.most_common(15)),
+            'avg_african_relevance': african_total / african_count if african_count else 0,
+            'avg_ai_relevance': ai_total / ai_count if ai_count else 0,
+            'avg_citations': citation_total / citation_count if citation_count else 0,
+            'high_relevance_papers': high_relevance_papers,
+            'recent_papers': recent_papers
         }
     
     def save_dataset(self, filename: str = 'unified_african_ai_dataset.json') -> str:
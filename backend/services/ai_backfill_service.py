@@ -92,9 +92,10 @@ class BackfillResult:
 class AIBackfillService:
     """AI-powered service for backfilling missing innovation properties"""
     
-    def __init__(self):
+    def __init__(self, perplexity_factory=PerplexityAfricanAIModule):
         self.openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         self.perplexity_key = settings.PERPLEXITY_API_KEY
+        self.perplexity_factory = perplexity_factory  # Called with the API key, used as an async context manager
         self.serper_key = settings.SERPER_API_KEY
         
         # Cost tracking
@@ -191,7 +192,8 @@ class AIBackfillService:
         
         # Determine overall priority
         priorities = [field.priority for field in missing_fields]
-        overall_priority = min(priorities)  # Highest priority (CRITICAL = lowest enum value)
+        ranking = list(BackfillPriority)  # Declared from CRITICAL down to LOW
+        overall_priority = min(priorities, key=ranking.index)
         
         job = BackfillJob(
             job_id=f"backfill_{innovation.get('id')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -283,7 +285,7 @@ class AIBackfillService:
         prompt = self._create_perplexity_prompt(job, field)
         
         try:
-            async with PerplexityAfricanAIModule(self.perplexity_key) as perplexity:
+            async with self.perplexity_factory(self.perplexity_key) as perplexity:
                 # Call Perplexity API
                 response = await perplexity._call_perplexity_api(prompt)
                 raw_content = response.get('choices', [{}])[0].get('message', {}).get('content', '')
@@ -3,34 +3,62 @@ ETL Job Context Manager
 Integrates monitoring into ETL jobs
 """
 
+import asyncio
 import time
 from contextlib import contextmanager
 from typing import Optional
 from services.etl_monitor import etl_monitor
 
 class ETLJobContext:
-    """Context manager for ETL job monitoring"""
-    
+    """Context manager for ETL job monitoring.
+
+    Use ``async with`` inside coroutines: the status file write on entry and exit
+    then runs in a worker thread instead of blocking the event loop.
+    """
+
     def __init__(self, job_name: str):
         self.job_name = job_name
         self.start_time = None
         self.items_processed = 0
-        
+
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         etl_monitor.start_job(self.job_name)
         return self
-        
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        runtime = time.time() - self.start_time if self.start_time else 0
-        
+        self._complete(exc_type, exc_val, persist=True)
+        return False  # Don't suppress exceptions
+
+    async def __aenter__(self):
+        await self._register()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._finalize(exc_type, exc_val)
+        return False  # Don't suppress exceptions
+
+    async def _register(self):
+        self.start_time = time.perf_counter_ns()
+        etl_monitor.start_job(self.job_name, persist=False)
+        await asyncio.to_thread(etl_monitor.save_status)
+
+    async def _finalize(self, exc_type, exc_val):
+        # complete_job schedules the idle transition on the running loop, so it stays on this thread
+        self._complete(exc_type, exc_val, persist=False)
+        await asyncio.to_thread(etl_monitor.save_status)
+
+    def _complete(self, exc_type, exc_val, persist: bool):
+        runtime = (time.perf_counter_ns() - self.start_time) / 1e9 if self.start_time else 0
+
         if exc_type is None:
             # Success
             etl_monitor.complete_job(
                 job_name=self.job_name,
                 success=True,
                 runtime=runtime,
-                items_processed=self.items_processed
+                items_processed=self.items_processed,
+                persist=persist
             )
         else:
             # Failure
@@ -40,11 +68,10 @@ class ETLJobContext:
                 success=False,
                 runtime=runtime,
                 items_processed=self.items_processed,
-                error_msg=error_msg
+                error_msg=error_msg,
+                persist=persist
             )
-        
-        return False  # Don't suppress exceptions
-    
+
     def add_processed_items(self, count: int):
         """Add to the count of items processed"""
         self.items_processed += count
@@ -6,6 +6,8 @@ Comprehensive status tracking and metrics collection for TAIFA-FIALA ETL pipelin
 import asyncio
 import json
 import logging
+import threading
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -70,9 +72,17 @@ class UnifiedETLStatus:
     last_updated: str
 
 class ETLMonitor:
+    # Dashboard polls within this window share one aggregation (system health alone samples CPU for 1s)
+    DASHBOARD_CACHE_TTL_SECONDS = 2.0
+
     def __init__(self):
         self.status_file = Path("backend/data/etl_status.json")
         self.job_statuses: Dict[str, ETLJobStatus] = {}
+        # save_status may run from worker threads (see ETLJobContext's async form)
+        self._save_lock = threading.Lock()
+        self._dashboard_lock = threading.Lock()
+        self._dashboard_cache: Optional[Dict] = None
+        self._dashboard_cached_at = 0.0
         self.initialize_jobs()
         self.load_status()
         
@@ -143,6 +153,10 @@ class ETLMonitor:
     
     def save_status(self):
         """Persist current status with comprehensive metrics"""
+        with self._save_lock:
+            self._write_status()
+
+    def _write_status(self):
         try:
             self.status_file.parent.mkdir(exist_ok=True)
             data = {}
@@ -166,8 +180,11 @@ class ETLMonitor:
         except Exception as e:
             logger.error(f"Error saving ETL status: {e}")
     
-    def start_job(self, job_name: str) -> bool:
-        """Mark job as running with proper state transitions"""
+    def start_job(self, job_name: str, persist: bool = True) -> bool:
+        """Mark job as running with proper state transitions.
+
+        With persist=False the caller is responsible for calling save_status.
+        """
         if job_name not in self.job_statuses:
             logger.error(f"Unknown job: {job_name}")
             return False
@@ -186,14 +203,19 @@ class ETLMonitor:
         # Reset metrics for new run
         status.metrics = ETLMetrics()
         
-        self.save_status()
+        self.invalidate_dashboard_cache()
+        if persist:
+            self.save_status()
         logger.info(f"Started ETL job: {job_name}")
         return True
     
     def complete_job(self, job_name: str, success: bool, runtime: float = 0, 
                     items_processed: int = 0, error_msg: str = None,
-                    metrics: Optional[ETLMetrics] = None):
-        """Update job status after completion with comprehensive metrics"""
+                    metrics: Optional[ETLMetrics] = None, persist: bool = True):
+        """Update job status after completion with comprehensive metrics.
+
+        With persist=False the caller is responsible for calling save_status.
+        """
         if job_name not in self.job_statuses:
             logger.error(f"Unknown job: {job_name}")
             return
@@ -245,7 +267,9 @@ class ETLMonitor:
         if success:
             asyncio.create_task(self._transition_to_idle(job_name, delay=5))
         
-        self.save_status()
+        self.invalidate_dashboard_cache()
+        if persist:
+            self.save_status()
     
     async def _transition_to_idle(self, job_name: str, delay: int = 5):
         """Transition job status from completed to idle after delay"""
@@ -254,6 +278,7 @@ class ETLMonitor:
             status = self.job_statuses[job_name]
             if status.status == "completed":
                 status.status = "idle"
+                self.invalidate_dashboard_cache()
                 self.save_status()
                 logger.info(f"Job {job_name} transitioned to idle")
     
@@ -393,7 +418,27 @@ class ETLMonitor:
         
         return "healthy"
     
+    def invalidate_dashboard_cache(self):
+        """Drop the cached dashboard so the next poll reflects a job state change"""
+        self._dashboard_cache = None
+
     def get_dashboard_data(self) -> Dict:
+        """Get complete dashboard data, reusing the last aggregation for DASHBOARD_CACHE_TTL_SECONDS
+        
+        Callers within the TTL receive the same dict, so it must be treated as read-only;
+        copy it before adding or changing fields.
+        """
+        with self._dashboard_lock:
+            if (self._dashboard_cache is not None and
+                    time.monotonic() - self._dashboard_cached_at < self.DASHBOARD_CACHE_TTL_SECONDS):
+                return self._dashboard_cache
+
+            dashboard_data = self._compute_dashboard_data()
+            self._dashboard_cache = dashboard_data
+            self._dashboard_cached_at = time.monotonic()
+            return dashboard_data
+
+    def _compute_dashboard_data(self) -> Dict:
         """Get complete dashboard data with enhanced metrics"""
         self.load_status()
         
@@ -0,0 +1,183 @@
+"""
+Local Vector Index for TAIFA-FIALA
+In-process stand-in for the Pinecone index, used for smoke tests and local development
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+from loguru import logger
+from pinecone import Pinecone
+
+from config.settings import settings
+from services.vector_service import VectorService
+
+# Normalized vectors are stored at half precision; scores are still accumulated in float32
+_STORAGE_DTYPE = np.float16
+
+_FILTER_OPERATORS = {
+    "$eq": lambda value, target: value == target,
+    "$ne": lambda value, target: value != target,
+    "$gt": lambda value, target: value is not None and value > target,
+    "$gte": lambda value, target: value is not None and value >= target,
+    "$lt": lambda value, target: value is not None and value < target,
+    "$lte": lambda value, target: value is not None and value <= target,
+    "$in": lambda value, target: value in target,
+    "$nin": lambda value, target: value not in target,
+}
+
+
+def _matches_filter(metadata: Dict[str, Any], filter_metadata: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate the subset of Pinecone's metadata filter language used by VectorService"""
+    if not filter_metadata:
+        return True
+    for field, condition in filter_metadata.items():
+        value = metadata.get(field)
+        if isinstance(condition, dict):
+            if not all(_FILTER_OPERATORS[op](value, target) for op, target in condition.items()):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class LocalVectorIndex:
+    """Exact cosine-similarity index held in memory as one normalized float16 matrix.
+
+    Implements the parts of the Pinecone ``Index`` interface VectorService calls
+    (upsert, query, fetch, delete, describe_index_stats), so searches run
+    without a network round-trip. The index is saved to ``path`` after every
+    write and reloaded on start.
+    """
+
+    def __init__(self, dimension: int, path: Optional[Path] = None):
+        self.dimension = dimension
+        self.path = path
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._metadata: List[Dict[str, Any]] = []
+        self._vectors = np.empty((0, dimension), dtype=_STORAGE_DTYPE)
+        if path and path.exists():
+            self._load()
+
+    def _load(self):
+        with np.load(self.path, allow_pickle=False) as data:
+            self._vectors = data["vectors"].astype(_STORAGE_DTYPE, copy=False)
+            self._ids = data["ids"].tolist()
+            self._metadata = json.loads(str(data["metadata"]))
+        self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+        logger.info(f"Loaded {len(self._ids)} vectors from local index {self.path}")
+
+    def _save(self):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as fh:
+            np.savez(fh, vectors=self._vectors, ids=np.array(self._ids, dtype=str),
+                     metadata=np.array(json.dumps(self._metadata)))
+
+    def upsert(self, vectors: List[Dict[str, Any]]):
+        if not vectors:
+            return
+        values = np.asarray([vector["values"] for vector in vectors], dtype=np.float32)
+        norms = np.linalg.norm(values, axis=1, keepdims=True)
+        values /= np.where(norms == 0, 1, norms)
+
+        new_rows = []
+        for vector, row in zip(vectors, values):
+            position = self._positions.get(vector["id"])
+            if position is None:
+                self._positions[vector["id"]] = len(self._ids)
+                self._ids.append(vector["id"])
+                self._metadata.append(vector.get("metadata", {}))
+                new_rows.append(row)
+            else:
+                self._vectors[position] = row
+                self._metadata[position] = vector.get("metadata", {})
+
+        if new_rows:
+            self._vectors = np.vstack([self._vectors, np.asarray(new_rows, dtype=_STORAGE_DTYPE)])
+        self._save()
+
+    def query(self, vector: List[float], top_k: int, include_metadata: bool = True,
+              filter: Optional[Dict[str, Any]] = None):
+        matches = []
+        if self._ids:
+            query = np.asarray(vector, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            scores = np.matmul(self._vectors, query / norm if norm else query, dtype=np.float32)
+
+            candidates = np.arange(len(self._ids))
+            if filter:
+                candidates = candidates[[_matches_filter(self._metadata[i], filter) for i in candidates]]
+
+            if len(candidates) > top_k:
+                best = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+                candidates = candidates[best]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            matches = [
+                SimpleNamespace(
+                    id=self._ids[i],
+                    score=float(scores[i]),
+                    metadata=self._metadata[i] if include_metadata else {}
+                )
+                for i in candidates
+            ]
+        return SimpleNamespace(matches=matches)
+
+    def fetch(self, ids: List[str]):
+        vectors = {
+            doc_id: SimpleNamespace(
+                id=doc_id,
+                values=self._vectors[self._positions[doc_id]].tolist(),
+                metadata=self._metadata[self._positions[doc_id]]
+            )
+            for doc_id in ids if doc_id in self._positions
+        }
+        return SimpleNamespace(vectors=vectors)
+
+    def delete(self, ids: List[str]):
+        removed = {self._positions[doc_id] for doc_id in ids if doc_id in self._positions}
+        if not removed:
+            return
+        keep = [i for i in range(len(self._ids)) if i not in removed]
+        self._vectors = self._vectors[keep]
+        self._ids = [self._ids[i] for i in keep]
+        self._metadata = [self._metadata[i] for i in keep]
+        self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+        self._save()
+
+    def describe_index_stats(self):
+        return SimpleNamespace(
+            total_vector_count=len(self._ids),
+            index_fullness=0.0,
+            dimension=self.dimension,
+            namespaces={"": {"vector_count": len(self._ids)}}
+        )
+
+
+class LocalVectorService(VectorService):
+    """VectorService that embeds through Pinecone inference but stores and searches locally"""
+
+    LOCAL_INDEX_DIR = Path(".cache/local_vectors")
+
+    async def initialize(self):
+        """Initialize the Pinecone inference client and the on-disk local index"""
+        try:
+            # Only the inference API is used remotely; no index handle is opened
+            self.pc = Pinecone(api_key=settings.PINECONE_API_KEY)
+
+            self.index = LocalVectorIndex(
+                self.EMBEDDING_DIMENSION,
+                self.LOCAL_INDEX_DIR / f"{self.index_name}.npz"
+            )
+
+            logger.info(f"Vector service initialized with local index: {self.index.path}")
+
+        except Exception as e:
+            logger.error(f"Error initializing local vector service: {e}")
+            raise
@@ -4,20 +4,75 @@ Precision search service for discovering African AI innovations and research
 """
 
 import asyncio
+import heapq
+import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from urllib.parse import quote
 
 import aiohttp
+from aiolimiter import AsyncLimiter
 from loguru import logger
 from pydantic import BaseModel, HttpUrl
 
 from config.settings import settings
 from services.unified_cache import (
-    cache_api_response, get_cached_response, cache_null_response, 
+    unified_cache, cache_api_response, get_cached_response, cache_null_response, 
     is_null_cached, DataSource
 )
 
+# Scoring tables, lowercased and weighted once at import rather than on every scored result.
+# Single words are matched against the text's word set, so "ai" no longer fires inside
+# "said"; multi-word phrases are found by one compiled alternation per scorer.
+_AFRICAN_COUNTRIES_LOWER = tuple(country.lower() for country in settings.AFRICAN_COUNTRIES)
+_AFRICAN_COUNTRY_WORDS = frozenset(c for c in _AFRICAN_COUNTRIES_LOWER if ' ' not in c)
+
+_AFRICAN_TERM_WORDS = frozenset({'africa', 'african', 'sub-saharan', 'maghreb', 'sahel'})
+
+_AFRICAN_PHRASE_WEIGHTS = {
+    **{country: 0.4 for country in _AFRICAN_COUNTRIES_LOWER if ' ' in country},
+    'east africa': 0.3, 'west africa': 0.3, 'north africa': 0.3, 'southern africa': 0.3
+}
+
+_INNOVATION_WORD_WEIGHTS = {
+    'startup': 0.2, 'innovation': 0.2, 'technology': 0.1, 'ai': 0.3, 'fintech': 0.2,
+    'healthtech': 0.2, 'agritech': 0.1, 'edtech': 0.1, 'digital': 0.1, 'platform': 0.1,
+    'app': 0.1, 'software': 0.1, 'solution': 0.1
+}
+_INNOVATION_PHRASE_WEIGHTS = {
+    'artificial intelligence': 0.3, 'machine learning': 0.3, 'tech company': 0.1
+}
+
+_FUNDING_WORDS = frozenset({
+    'raised', 'funding', 'investment', 'million', 'billion', 'round', 'series',
+    'seed', 'vc', 'investor', 'invested', 'capital', 'financing'
+})
+
+
+def _phrase_pattern(phrases) -> re.Pattern:
+    """Compile phrases into one alternation, longest first so none shadows a longer one"""
+    return re.compile('|'.join(map(re.escape, sorted(phrases, key=len, reverse=True))))
+
+
+_AFRICAN_PHRASE_RE = _phrase_pattern(_AFRICAN_PHRASE_WEIGHTS)
+_INNOVATION_PHRASE_RE = _phrase_pattern(_INNOVATION_PHRASE_WEIGHTS)
+_FUNDING_PHRASE_RE = _phrase_pattern(['venture capital'])
+
+_WORD_RE = re.compile(r"\w+(?:-\w+)*")
+
+
+def _text_tokens(text: str) -> set:
+    """Words of lowercase text, with hyphenated compounds split and plurals folded"""
+    tokens = set()
+    for word in _WORD_RE.findall(text):
+        tokens.add(word)
+        if '-' in word:
+            tokens.update(word.split('-'))
+    # "startups" and "ai-powered" should still count as "startup" and "ai"
+    tokens.update([token[:-1] for token in tokens if token.endswith('s')])
+    return tokens
+
 
 class SearchResult(BaseModel):
     """Individual search result from Serper"""
@@ -43,14 +98,30 @@ class SerperSearchResponse(BaseModel):
 class SerperService:
     """Service for precision searches using Serper.dev API"""
     
+    # Queries in a batch run concurrently, bounded and paced to stay under Serper's rate limit
+    MAX_CONCURRENT_REQUESTS = 5
+    REQUESTS_PER_SECOND = 5
+    
     def __init__(self):
         self.api_key = settings.SERPER_API_KEY
         self.base_url = "https://google.serper.dev"
         self.session = None
+        self.semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self.limiter = AsyncLimiter(self.REQUESTS_PER_SECOND, 1)
         
     async def __aenter__(self):
         """Async context manager entry"""
+        # One pooled connector sized to the concurrency cap, so batched queries reuse
+        # warm keep-alive connections to Serper instead of a new TLS handshake each
+        connector = aiohttp.TCPConnector(
+            limit=self.MAX_CONCURRENT_REQUESTS,
+            limit_per_host=self.MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             headers={
                 "X-API-KEY": self.api_key,
                 "Content-Type": "application/json"
@@ -118,7 +189,7 @@ class SerperService:
             if date_range:
                 payload["tbs"] = f"qdr:{date_range}"  # y=year, m=month, w=week, d=day
             
-            async with self.session.post(f"{self.base_url}/search", json=payload) as response:
+            async with self.semaphore, self.limiter, self.session.post(f"{self.base_url}/search", json=payload) as response:
                 if response.status == 200:
                     data = await response.json()
                     search_response = self.parse_web_results(query, data)
@@ -192,7 +263,7 @@ class SerperService:
                 "tbs": f"qdr:d{days_back}"  # Last N days
             }
             
-            async with self.session.post(f"{self.base_url}/news", json=payload) as response:
+            async with self.semaphore, self.limiter, self.session.post(f"{self.base_url}/news", json=payload) as response:
                 if response.status == 200:
                     data = await response.json()
                     return self.parse_news_results(query, data)
@@ -220,7 +291,34 @@ class SerperService:
     
     async def search_scholar(self, query: str, num_results: int = 20,
                            year_from: Optional[int] = None) -> SerperSearchResponse:
-        """Perform academic search using Serper (Google Scholar)"""
+        """Perform academic search using Serper (Google Scholar), reusing cached results"""
+        cache_params = {
+            'query': query,
+            'num_results': num_results,
+            'year_from': year_from,
+            'search_type': 'scholar'
+        }
+        
+        # Identical searches are served from the cache instead of billing another Serper call
+        try:
+            cached_response = await get_cached_response(DataSource.SERPER, cache_params)
+            if cached_response:
+                logger.info(f"Using cached Serper scholar search for: {query}")
+                return SerperSearchResponse.model_validate(cached_response)
+            
+            if await is_null_cached(DataSource.SERPER, cache_params):
+                logger.info(f"Serper scholar search cached as null: {query}")
+                return SerperSearchResponse(
+                    query=query,
+                    results=[],
+                    total_results=0,
+                    search_time=0.0,
+                    timestamp=datetime.now(),
+                    search_type="scholar"
+                )
+        except Exception as e:
+            logger.warning(f"Error checking Serper cache: {e}")
+        
         try:
             payload = {
                 "q": query,
@@ -230,10 +328,20 @@ class SerperService:
             if year_from:
                 payload["as_ylo"] = year_from
             
-            async with self.session.post(f"{self.base_url}/scholar", json=payload) as response:
+            async with self.semaphore, self.limiter, self.session.post(f"{self.base_url}/scholar", json=payload) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return self.parse_scholar_results(query, data)
+                    search_response = self.parse_scholar_results(query, data)
+                    
+                    # Publication listings change slowly, so results are kept for a day
+                    if search_response.results:
+                        await cache_api_response(DataSource.SERPER, cache_params,
+                                                 search_response.model_dump(mode='json'), 24.0)
+                    else:
+                        await cache_null_response(DataSource.SERPER, cache_params,
+                                                  "no_results", 6.0)
+                    
+                    return search_response
                 else:
                     logger.error(f"Serper scholar search error: {response.status}")
                     return SerperSearchResponse(
@@ -378,33 +486,37 @@ class SerperService:
             ]
             base_queries.extend(country_queries)
         
-        all_results = []
         results_per_query = max(10, num_results // len(base_queries))
         
-        for query in base_queries:
+        async def run_query(query: str) -> List[SearchResult]:
             try:
                 # Search both web and news
-                web_results = await self.search_web(query, results_per_query)
-                news_results = await self.search_news(query, results_per_query // 2, days_back=180)
-                
-                all_results.extend(web_results.results)
-                all_results.extend(news_results.results)
-                
-                # Rate limiting
-                await asyncio.sleep(1)
-                
+                web_results, news_results = await asyncio.gather(
+                    self.search_web(query, results_per_query),
+                    self.search_news(query, results_per_query // 2, days_back=180)
+                )
+                return web_results.results + news_results.results
             except Exception as e:
                 logger.error(f"Error searching for query '{query}': {e}")
-                continue
+                return []
+        
+        # Requests are bounded and paced by the shared semaphore and limiter; their
+        # cache lookups all share the Redis client held open here
+        async with unified_cache:
+            all_results = [
+                result
+                for query_results in await asyncio.gather(*(run_query(query) for query in base_queries))
+                for result in query_results
+            ]
         
         # Remove duplicates and filter results
         unique_results = self.deduplicate_results(all_results)
-        filtered_results = self.filter_african_innovation_results(unique_results)
+        scored_results = self._score_innovation_results(unique_results)
         
-        # Sort by relevance
-        sorted_results = sorted(filtered_results, key=self.calculate_relevance_score, reverse=True)
+        # Only the top results are returned, so select them rather than sorting everything
+        top_results = heapq.nlargest(num_results, scored_results, key=itemgetter(0))
         
-        return sorted_results[:num_results]
+        return [result for _, result in top_results]
     
     async def search_innovation_funding(self, days_back: int = 30,
                                       min_amount: Optional[float] = None) -> List[SearchResult]:
@@ -419,18 +531,20 @@ class SerperService:
             "African innovation funding investment news"
         ]
         
-        all_results = []
-        
-        for query in funding_queries:
+        async def run_query(query: str) -> List[SearchResult]:
             try:
                 news_results = await self.search_news(query, 20, days_back)
-                all_results.extend(news_results.results)
-                
-                await asyncio.sleep(1)
-                
+                return news_results.results
             except Exception as e:
                 logger.error(f"Error searching funding query '{query}': {e}")
-                continue
+                return []
+        
+        async with unified_cache:
+            all_results = [
+                result
+                for query_results in await asyncio.gather(*(run_query(query) for query in funding_queries))
+                for result in query_results
+            ]
         
         # Filter for funding mentions
         funding_results = []
@@ -443,31 +557,37 @@ class SerperService:
     async def search_research_papers(self, keywords: List[str], 
                                    year_from: int = 2020) -> List[SearchResult]:
         """Search for African AI research papers"""
+        return [paper async for paper in self.stream_research_papers(keywords, year_from)]
+    
+    async def stream_research_papers(self, keywords: List[str],
+                                     year_from: int = 2020) -> AsyncIterator[SearchResult]:
+        """Yield unique African AI research papers as each keyword's search completes"""
         logger.info(f"Searching for research papers with keywords: {keywords}")
         
-        all_results = []
-        
-        for keyword in keywords:
+        async def run_query(keyword: str) -> List[SearchResult]:
             try:
                 # Build academic query
                 academic_query = f"{keyword} Africa OR African"
                 
                 scholar_results = await self.search_scholar(academic_query, 25, year_from)
-                all_results.extend(scholar_results.results)
-                
-                await asyncio.sleep(1)
-                
+                return scholar_results.results
             except Exception as e:
                 logger.error(f"Error searching papers for '{keyword}': {e}")
-                continue
+                return []
         
-        # Filter for African relevance
-        african_papers = []
-        for result in all_results:
-            if self.has_african_relevance(result.title + " " + result.snippet):
-                african_papers.append(result)
+        seen_urls = set()
         
-        return self.deduplicate_results(african_papers)
+        # Consumers can handle each paper while slower keyword searches are still in flight
+        for next_results in asyncio.as_completed([run_query(keyword) for keyword in keywords]):
+            for result in await next_results:
+                url = str(result.link)
+                
+                # Filter for African relevance, then drop papers already yielded
+                if url in seen_urls or not self.has_african_relevance(result.title + " " + result.snippet):
+                    continue
+                
+                seen_urls.add(url)
+                yield result
     
     def deduplicate_results(self, results: List[SearchResult]) -> List[SearchResult]:
         """Remove duplicate results based on URL"""
@@ -475,70 +595,56 @@ class SerperService:
         unique_results = []
         
         for result in results:
-            if str(result.link) not in seen_urls:
-                seen_urls.add(str(result.link))
+            url = str(result.link)
+            if url not in seen_urls:
+                seen_urls.add(url)
                 unique_results.append(result)
         
         return unique_results
     
     def filter_african_innovation_results(self, results: List[SearchResult]) -> List[SearchResult]:
         """Filter results for African innovation relevance"""
-        filtered = []
+        return [result for _, result in self._score_innovation_results(results)]
+    
+    def _score_innovation_results(self, results: List[SearchResult]) -> List[Tuple[float, SearchResult]]:
+        """Pair each African innovation result with its ranking score, dropping irrelevant ones"""
+        scored = []
         
         for result in results:
+            # Built once per result and shared by both scorers
             text = f"{result.title} {result.snippet}".lower()
             
-            # Check for African relevance
+            # Check for African relevance; most results fail here, so skip the innovation scoring
             african_score = self.calculate_african_relevance_score(text)
+            if african_score < 0.3:
+                continue
             
             # Check for innovation/tech relevance
             innovation_score = self.calculate_innovation_relevance_score(text)
             
             # Combined relevance threshold
-            if african_score >= 0.3 and innovation_score >= 0.2:
-                filtered.append(result)
+            if innovation_score >= 0.2:
+                scored.append((self._combine_relevance_scores(result, african_score, innovation_score), result))
         
-        return filtered
+        return scored
     
     def calculate_african_relevance_score(self, text: str) -> float:
         """Calculate African relevance score for text"""
-        score = 0.0
+        tokens = _text_tokens(text)
         
-        # African countries
-        for country in settings.AFRICAN_COUNTRIES:
-            if country.lower() in text:
-                score += 0.4
-        
-        # African terms
-        african_terms = [
-            'africa', 'african', 'sub-saharan', 'maghreb', 'sahel',
-            'east africa', 'west africa', 'north africa', 'southern africa'
-        ]
-        
-        for term in african_terms:
-            if term in text:
-                score += 0.3
+        # African countries and terms
+        score = 0.4 * len(_AFRICAN_COUNTRY_WORDS & tokens)
+        score += 0.3 * len(_AFRICAN_TERM_WORDS & tokens)
+        score += sum(_AFRICAN_PHRASE_WEIGHTS[phrase] for phrase in set(_AFRICAN_PHRASE_RE.findall(text)))
         
         return min(score, 1.0)
     
     def calculate_innovation_relevance_score(self, text: str) -> float:
         """Calculate innovation/tech relevance score for text"""
-        score = 0.0
+        tokens = _text_tokens(text)
         
-        innovation_terms = [
-            'startup', 'innovation', 'technology', 'ai', 'artificial intelligence',
-            'machine learning', 'fintech', 'healthtech', 'agritech', 'edtech',
-            'tech company', 'digital', 'platform', 'app', 'software', 'solution'
-        ]
-        
-        for term in innovation_terms:
-            if term in text:
-                if term in ['ai', 'artificial intelligence', 'machine learning']:
-                    score += 0.3
-                elif term in ['startup', 'innovation', 'fintech', 'healthtech']:
-                    score += 0.2
-                else:
-                    score += 0.1
+        score = sum(_INNOVATION_WORD_WEIGHTS[word] for word in tokens & _INNOVATION_WORD_WEIGHTS.keys())
+        score += sum(_INNOVATION_PHRASE_WEIGHTS[phrase] for phrase in set(_INNOVATION_PHRASE_RE.findall(text)))
         
         return min(score, 1.0)
     
@@ -549,6 +655,11 @@ class SerperService:
         african_score = self.calculate_african_relevance_score(text)
         innovation_score = self.calculate_innovation_relevance_score(text)
         
+        return self._combine_relevance_scores(result, african_score, innovation_score)
+    
+    def _combine_relevance_scores(self, result: SearchResult, african_score: float,
+                                  innovation_score: float) -> float:
+        """Weight African and innovation scores with the result's search position"""
         # Position penalty (higher position = lower relevance)
         position_factor = max(0.1, 1.0 - (result.position - 1) * 0.05)
         
@@ -556,14 +667,9 @@ class SerperService:
     
     def contains_funding_keywords(self, text: str) -> bool:
         """Check if text contains funding-related keywords"""
-        funding_keywords = [
-            'raised', 'funding', 'investment', 'million', 'billion',
-            'round', 'series', 'seed', 'venture capital', 'vc',
-            'investor', 'invested', 'capital', 'financing'
-        ]
-        
         text_lower = text.lower()
-        return any(keyword in text_lower for keyword in funding_keywords)
+        return (not _FUNDING_WORDS.isdisjoint(_text_tokens(text_lower))
+                or _FUNDING_PHRASE_RE.search(text_lower) is not None)
     
     def has_african_relevance(self, text: str) -> bool:
         """Check if text has African relevance"""
@@ -125,6 +125,10 @@ class UnifiedCacheService:
                 self.redis_url = base_url
         
         self.redis: Optional[aioredis.Redis] = None
+        # Open `async with` blocks sharing self.redis; the client is closed when the last one exits,
+        # so concurrently gathered callers never close a connection another caller is using
+        self._users = 0
+        self._connect_lock = asyncio.Lock()
         
         # Memory cache (L1) - for frequently accessed small items
         self.memory_cache = TTLCache(maxsize=1000, ttl=300)  # 5 minutes
@@ -177,19 +181,25 @@ class UnifiedCacheService:
         }
 
     async def __aenter__(self):
-        """Async context manager entry"""
-        self.redis = await aioredis.from_url(
-            self.redis_url, 
-            decode_responses=False,  # Handle binary data for compression
-            socket_keepalive=True,
-            socket_keepalive_options={}
-        )
+        """Async context manager entry; nested and concurrent entries share one client"""
+        async with self._connect_lock:
+            if self.redis is None:
+                self.redis = await aioredis.from_url(
+                    self.redis_url, 
+                    decode_responses=False,  # Handle binary data for compression
+                    socket_keepalive=True,
+                    socket_keepalive_options={}
+                )
+            self._users += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.redis:
-            await self.redis.close()
+        """Async context manager exit; the client is closed once no block is using it"""
+        async with self._connect_lock:
+            self._users -= 1
+            if self._users == 0 and self.redis:
+                redis, self.redis = self.redis, None
+                await redis.close()
 
     def _generate_cache_key(self, data_source: DataSource, cache_type: CacheType, 
                            query_params: Dict[str, Any]) -> str:
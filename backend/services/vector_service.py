@@ -4,6 +4,10 @@ Pinecone integration for Dense inference-enabled index with multilingual-e5-larg
 """
 
 import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from uuid import UUID, uuid4
 
@@ -29,13 +33,66 @@ class SearchResult(BaseModel):
     content: Optional[str] = None
 
 
+class DiskEmbeddingCache:
+    """Embeddings persisted as one JSON file per text, so repeated runs skip re-embedding.
+
+    Files are keyed by sha256 of model, dimension and text, so changing either
+    the model or the dimension naturally misses the old entries.
+    """
+
+    def __init__(self, directory: str, model: str, dimension: int):
+        self.directory = Path(directory)
+        self.model = model
+        self.dimension = dimension
+
+    def _path(self, text: str) -> Path:
+        key = hashlib.sha256(f"{self.model}:{self.dimension}:{text}".encode("utf-8")).hexdigest()
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, text: str) -> Optional[List[float]]:
+        try:
+            embedding = json.loads(self._path(text).read_text())
+        except (OSError, ValueError):
+            return None
+        return embedding if len(embedding) == self.dimension else None
+
+    def put(self, text: str, embedding: List[float]) -> None:
+        if len(embedding) != self.dimension:
+            return
+        path = self._path(text)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(embedding))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write embedding cache entry {path}: {e}")
+
+
 class VectorService:
     """Service for vector operations using Pinecone Dense inference index"""
 
+    EMBEDDING_MODEL = "multilingual-e5-large"
+    EMBEDDING_DIMENSION = 1024
+    # Repeated texts (fixed search queries, re-upserted documents) reuse their embedding
+    EMBEDDING_CACHE_SIZE = 1024
+    # Largest input list Pinecone's inference API accepts for multilingual-e5-large
+    EMBED_BATCH_SIZE = 96
+    # Most ids Pinecone accepts in a single delete request
+    DELETE_BATCH_SIZE = 1000
+
     def __init__(self):
         self.pc = None
         self.index = None
         self.index_name = settings.PINECONE_INDEX
+        self._embedding_cache: OrderedDict[str, tuple] = OrderedDict()
+        self.embedding_cache_hits = 0
+        self.embedding_cache_misses = 0
+        self._disk_cache = (
+            DiskEmbeddingCache(settings.EMBEDDING_CACHE_DIR, self.EMBEDDING_MODEL, self.EMBEDDING_DIMENSION)
+            if settings.EMBEDDING_CACHE_DIR else None
+        )
 
     async def initialize(self):
         """Initialize Pinecone client"""
@@ -71,27 +128,84 @@ class VectorService:
             return ""
 
     async def embed_text(self, text: str) -> List[float]:
-        """Generate embedding using Pinecone's inference API"""
+        """Generate embedding using Pinecone's inference API, served from an LRU cache when seen before"""
+        embeddings = await self.embed_texts([text])
+        return embeddings[0]
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for many texts, sending only uncached ones to Pinecone in batches"""
+        embeddings: List[List[float]] = [[] for _ in texts]
+        uncached: Dict[str, List[int]] = {}
+
+        for position, text in enumerate(texts):
+            cached = self._embedding_cache.get(text)
+            if cached is not None:
+                self._embedding_cache.move_to_end(text)
+                self.embedding_cache_hits += 1
+                embeddings[position] = list(cached)
+                continue
+
+            cached = self._disk_cache.get(text) if self._disk_cache else None
+            if cached is not None:
+                self._remember_embedding(text, cached)
+                self.embedding_cache_hits += 1
+                embeddings[position] = list(cached)
+            else:
+                self.embedding_cache_misses += 1
+                uncached.setdefault(text, []).append(position)
+
+        if not uncached:
+            return embeddings
+
         try:
             if not self.index:
                 await self.initialize()
 
-            # Use Pinecone's inference to embed text
-            response = self.pc.inference.embed(
-                model="multilingual-e5-large",
-                inputs=[text],
-                parameters={"input_type": "passage"}
-            )
+            pending = list(uncached)
+            for start in range(0, len(pending), self.EMBED_BATCH_SIZE):
+                batch = pending[start:start + self.EMBED_BATCH_SIZE]
+
+                # Use Pinecone's inference to embed the whole batch in one request; the SDK
+                # call blocks, so it runs in a worker thread and other tasks keep going
+                response = await asyncio.to_thread(
+                    self.pc.inference.embed,
+                    model=self.EMBEDDING_MODEL,
+                    inputs=batch,
+                    parameters={"input_type": "passage"}
+                )
 
-            if response and len(response) > 0:
-                return response[0]['values']
-            else:
-                logger.error("Empty embedding response from Pinecone")
-                return []
+                if not response or len(response) == 0:
+                    logger.error("Empty embedding response from Pinecone")
+                    continue
+
+                for text, item in zip(batch, response):
+                    embedding = item['values']
+                    self._remember_embedding(text, embedding)
+                    if self._disk_cache:
+                        self._disk_cache.put(text, embedding)
+                    for position in uncached[text]:
+                        embeddings[position] = embedding
 
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
-            return []
+
+        return embeddings
+
+    def _remember_embedding(self, text: str, embedding: List[float]) -> None:
+        """Store an embedding in the in-memory LRU cache, evicting the oldest entry when full"""
+        self._embedding_cache[text] = tuple(embedding)
+        if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+
+    def embedding_cache_info(self) -> Dict[str, Any]:
+        """Hit/miss counts and current size of the embedding cache"""
+        lookups = self.embedding_cache_hits + self.embedding_cache_misses
+        return {
+            "hits": self.embedding_cache_hits,
+            "misses": self.embedding_cache_misses,
+            "size": len(self._embedding_cache),
+            "hit_rate": self.embedding_cache_hits / lookups if lookups else 0.0
+        }
 
     async def upsert_documents(self, documents: List[VectorDocument]) -> bool:
         """Upsert documents to Pinecone using embeddings"""
@@ -107,14 +221,18 @@ class VectorService:
                 batch = documents[i:i+batch_size]
                 vectors_to_upsert = []
 
-                for doc in batch:
-                    prepared_text = self.prepare_text(doc.content)
+                prepared_texts = [self.prepare_text(doc.content) for doc in batch]
+
+                # Generate embeddings for the whole batch at once
+                embeddings = await self.embed_texts([text for text in prepared_texts if text])
+                embedding_iter = iter(embeddings)
+
+                for doc, prepared_text in zip(batch, prepared_texts):
                     if not prepared_text:
                         logger.warning(f"Skipping document {doc.id} - no content")
                         continue
 
-                    # Generate embedding
-                    embedding = await self.embed_text(prepared_text)
+                    embedding = next(embedding_iter)
                     if not embedding:
                         logger.warning(f"Skipping document {doc.id} - embedding failed")
                         continue
@@ -224,6 +342,22 @@ class VectorService:
                            innovation_type: str, country: str,
                            additional_metadata: Optional[Dict[str, Any]] = None) -> bool:
         """Add innovation to vector database"""
+        document = self._innovation_document(innovation_id, title, description, innovation_type,
+                                             country, additional_metadata)
+        return await self.upsert_documents([document])
+
+    async def add_innovations_bulk(self, innovations: List[Dict[str, Any]]) -> bool:
+        """Add many innovations at once; embeddings and upserts are batched by upsert_documents.
+
+        Each dict takes the keyword arguments of add_innovation.
+        """
+        documents = [self._innovation_document(**innovation) for innovation in innovations]
+        return await self.upsert_documents(documents)
+
+    def _innovation_document(self, innovation_id: UUID, title: str, description: str,
+                             innovation_type: str, country: str,
+                             additional_metadata: Optional[Dict[str, Any]] = None) -> VectorDocument:
+        """Build the vector document stored for an innovation"""
         combined_text = f"{title}. {description}"
 
         metadata = {
@@ -238,14 +372,12 @@ class VectorService:
         if additional_metadata:
             metadata.update(additional_metadata)
 
-        document = VectorDocument(
+        return VectorDocument(
             id=f"innovation_{innovation_id}",
             content=combined_text,
             metadata=metadata
         )
 
-        return await self.upsert_documents([document])
-
     async def add_publication(self, publication_id: UUID, title: str, abstract: str,
                             publication_type: str, authors: List[str],
                             year: Optional[int] = None,
@@ -373,15 +505,45 @@ class VectorService:
             logger.error(f"Error deleting document {document_id}: {e}")
             return False
 
+    async def delete_documents(self, document_ids: List[str]) -> bool:
+        """Delete many documents from vector database, one request per DELETE_BATCH_SIZE ids"""
+        try:
+            if not self.index:
+                await self.initialize()
+
+            for start in range(0, len(document_ids), self.DELETE_BATCH_SIZE):
+                self.index.delete(ids=document_ids[start:start + self.DELETE_BATCH_SIZE])
+            logger.info(f"Deleted {len(document_ids)} documents")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting {len(document_ids)} documents: {e}")
+            return False
+
+
+def _create_vector_service() -> VectorService:
+    """Pinecone-backed service, or the in-process index when USE_LOCAL_VECTOR is set"""
+    if settings.USE_LOCAL_VECTOR:
+        from services.local_vector_service import LocalVectorService
+        return LocalVectorService()
+    return VectorService()
+
 
-# Global vector service instance
-vector_service = VectorService()
+# Global vector service instance, created on first use: LocalVectorService subclasses
+# VectorService, so it can only be imported once this module has finished loading
+vector_service: Optional[VectorService] = None
+_vector_service_lock = asyncio.Lock()
 
 
 async def get_vector_service() -> VectorService:
-    """Get initialized vector service"""
-    if not vector_service.index:
-        await vector_service.initialize()
+    """Get initialized vector service, connecting to Pinecone only once even under concurrent callers"""
+    global vector_service
+    if vector_service is None or not vector_service.index:
+        async with _vector_service_lock:
+            if vector_service is None:
+                vector_service = _create_vector_service()
+            if not vector_service.index:
+                await vector_service.initialize()
     return vector_service
 
 
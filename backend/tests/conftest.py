@@ -0,0 +1,34 @@
+"""
+Shared fixtures for backend tests
+"""
+
+import types
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def _shared_service():
+    """Single AIBackfillService instance reused by every test in the session"""
+    # Imported here so modules that don't use the service collect without its dependencies
+    from services.ai_backfill_service import AIBackfillService
+    
+    service = AIBackfillService()
+    service.perplexity_key = 'test'
+    service.serper_key = 'test'
+    yield service
+
+
+@pytest.fixture
+def fresh_service(_shared_service):
+    """Shared AIBackfillService reset to a clean state, with the OpenAI client mocked out"""
+    _shared_service.openai_client = types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=AsyncMock()))
+    )
+    _shared_service.daily_cost_limit = 50.0
+    _shared_service.current_daily_cost = 0.0
+    _shared_service.last_cost_reset = datetime.now().date()
+    _shared_service.job_queue = []
+    return _shared_service
@@ -4,16 +4,26 @@ Comprehensive Tests for AI Backfill Service
 
 Test suite for the Perplexity + OpenAI backfilling system.
 Tests both unit functionality and integration scenarios.
+
+Tests share one AIBackfillService per session (tests/conftest.py), reset
+before each test, so the module can still run in parallel; each xdist
+worker gets its own instance:
+    pytest -n auto tests/test_ai_backfill_service.py
 """
 
 import pytest
 import asyncio
+import copy
+import dataclasses
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+import re
+import types
+from unittest.mock import patch
 from datetime import datetime, timedelta
 
+from freezegun import freeze_time
+
 from services.ai_backfill_service import (
-    AIBackfillService, 
     BackfillJob, 
     BackfillStatus, 
     BackfillPriority,
@@ -22,100 +32,272 @@ from services.ai_backfill_service import (
 )
 
 
+# Every test here is async; run them all on one shared event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Shared creation timestamp for every BackfillJob built in this module
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Sections a funding prompt must contain, in order
+_PROMPT_RE = re.compile(
+    r"(Test Innovation).*(funding).*(investment rounds).*(investor names)",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Static OpenAI parsing responses, serialized once
+_FUNDING_OPENAI_JSON = json.dumps({
+    "value": {
+        "amount": 250000000,
+        "currency": "USD",
+        "round": "Series C",
+        "investor": "Avenir Growth Capital"
+    },
+    "confidence": 0.9,
+    "supporting_evidence": ["$250 million in Series C funding", "led by Avenir Growth Capital"],
+    "source_reliability": "high",
+    "verification_notes": "Multiple sources confirm the funding amount"
+})
+
+_FUNDING_OPENAI_JSON_SHORT = json.dumps({
+    "value": {"amount": 250000000, "currency": "USD"},
+    "confidence": 0.85
+})
+
+class _StubChatCompletions:
+    """Minimal stand-in for openai_client.chat.completions returning a fixed message"""
+    
+    def __init__(self, payload):
+        # Only .choices[0].message.content is read, so build the response once
+        self._response = types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=payload))]
+        )
+    
+    async def create(self, **kwargs):
+        return self._response
+
+
+class _StubOpenAI:
+    """Minimal stand-in for openai.AsyncOpenAI"""
+    
+    def __init__(self, payload):
+        self.chat = types.SimpleNamespace(completions=_StubChatCompletions(payload))
+
+
+class _StubPerplexity:
+    """Minimal stand-in for PerplexityAfricanAIModule returning a fixed API response"""
+    
+    def __init__(self, response):
+        self._response = response
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+    
+    async def _call_perplexity_api(self, prompt):
+        return self._response
+
+
+# Innovation records used across the suite, parsed once at import.
+# Tests that mutate a record take a deep copy; the rest share these dicts.
+_JSON_BLOB = """
+{
+    "flutterwave_missing": {
+        "id": "test-innovation-123",
+        "title": "Flutterwave",
+        "description": "Nigerian fintech company providing payment infrastructure for Africa",
+        "innovation_type": "FinTech",
+        "verification_status": "verified",
+        "fundings": [],
+        "website_url": null,
+        "organizations": [],
+        "individuals": [],
+        "impact_metrics": {},
+        "github_url": null,
+        "demo_url": null
+    },
+    "critical": {
+        "id": "critical-001",
+        "title": "Critical Innovation",
+        "description": "Verified innovation missing critical data",
+        "verification_status": "verified",
+        "fundings": [],
+        "website_url": null,
+        "organizations": []
+    },
+    "mostly_complete": {
+        "id": "low-001",
+        "title": "Low Priority Innovation",
+        "description": "Innovation with most data present",
+        "verification_status": "community",
+        "fundings": [{"amount": 100000}],
+        "website_url": "https://example.com",
+        "organizations": [{"name": "Test Org"}],
+        "demo_url": null
+    },
+    "real_world": [
+        {
+            "id": "flutterwave-001",
+            "title": "Flutterwave",
+            "description": "Payment infrastructure for global merchants and payment service providers",
+            "innovation_type": "FinTech",
+            "verification_status": "verified",
+            "fundings": [],
+            "website_url": null,
+            "organizations": []
+        },
+        {
+            "id": "mpesa-002",
+            "title": "M-Pesa",
+            "description": "Mobile money transfer service launched by Vodafone",
+            "innovation_type": "FinTech",
+            "verification_status": "verified",
+            "fundings": [{"amount": 1000000, "currency": "USD"}],
+            "website_url": "https://mpesa.com",
+            "organizations": []
+        }
+    ]
+}
+"""
+_INNOVATIONS = json.loads(_JSON_BLOB)
+
+# Base job and funding field that tests specialise with dataclasses.replace
+_TEMPLATE_JOB = BackfillJob(
+    job_id='tmpl',
+    innovation_id='tmpl',
+    innovation_title='tmpl',
+    innovation_description='tmpl',
+    missing_fields=[],
+    status=BackfillStatus.PENDING,
+    priority=BackfillPriority.HIGH,
+    created_at=_FIXED_NOW
+)
+
+_FUNDING_FIELD = MissingField(
+    field_name='funding_amount',
+    field_type='funding',
+    priority=BackfillPriority.CRITICAL,
+    search_strategy='perplexity',
+    estimated_cost=0.10
+)
+
+
+def _make_job(**overrides) -> BackfillJob:
+    """Copy the template job with overrides, giving it its own missing_fields list"""
+    return dataclasses.replace(_TEMPLATE_JOB, **{'missing_fields': [], **overrides})
+
+# analyze_missing_fields results keyed by innovation snapshot, shared across tests
+_MISSING_FIELDS_CACHE = {}
+
+
+def _hash_innovation(innovation):
+    """Build a hashable snapshot of an innovation dict for cache lookups"""
+    return (innovation.get('id'), json.dumps(innovation, sort_keys=True, default=str))
+
+
 class TestAIBackfillService:
     """Test suite for AIBackfillService"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="function")
     def mock_innovation(self):
         """Mock innovation data for testing"""
-        return {
-            'id': 'test-innovation-123',
-            'title': 'Flutterwave',
-            'description': 'Nigerian fintech company providing payment infrastructure for Africa',
-            'innovation_type': 'FinTech',
-            'verification_status': 'verified',
-            'fundings': [],  # Missing funding info
-            'website_url': None,  # Missing website
-            'organizations': [],  # Missing organization info
-            'individuals': [],  # Missing team info
-            'impact_metrics': {},  # Missing metrics
-            'github_url': None,
-            'demo_url': None
-        }
+        return copy.deepcopy(_INNOVATIONS["flutterwave_missing"])
     
     @pytest.fixture
-    def backfill_service(self):
-        """Create AIBackfillService instance with mocked APIs"""
-        service = AIBackfillService()
-        service.openai_client = AsyncMock()
-        service.perplexity_key = 'test-perplexity-key'
-        service.serper_key = 'test-serper-key'
-        return service
+    def backfill_service(self, fresh_service):
+        """The session's shared AIBackfillService, reset for this test (see conftest.py)"""
+        return fresh_service
     
-    @pytest.mark.asyncio
-    async def test_analyze_missing_fields(self, backfill_service, mock_innovation):
-        """Test identification of missing fields"""
-        
-        missing_fields = await backfill_service.analyze_missing_fields(mock_innovation)
-        
-        # Should identify all missing critical and high-priority fields
-        field_names = [field.field_name for field in missing_fields]
-        assert 'funding_amount' in field_names
-        assert 'website_url' in field_names
-        assert 'founding_organization' in field_names
-        assert 'key_team_members' in field_names
+    @pytest.fixture
+    def cached_missing_fields(self, backfill_service, monkeypatch):
+        """Memoize analyze_missing_fields, including calls made by create_backfill_job"""
+        analyze = backfill_service.analyze_missing_fields
+        
+        async def _cached(innovation):
+            key = _hash_innovation(innovation)
+            if key not in _MISSING_FIELDS_CACHE:
+                _MISSING_FIELDS_CACHE[key] = await analyze(innovation)
+            return _MISSING_FIELDS_CACHE[key]
+        
+        monkeypatch.setattr(backfill_service, 'analyze_missing_fields', _cached)
+        return _cached
+    
+    @pytest.mark.parametrize("innovation,expected_priority,expected_fields", [
+        pytest.param(
+            _INNOVATIONS["flutterwave_missing"],
+            BackfillPriority.CRITICAL,
+            {
+                'funding_amount': BackfillPriority.CRITICAL,
+                'website_url': BackfillPriority.CRITICAL,
+                'founding_organization': BackfillPriority.HIGH,
+                'key_team_members': BackfillPriority.HIGH,
+                'github_url': BackfillPriority.MEDIUM,
+                'user_metrics': BackfillPriority.MEDIUM,
+                'demo_url': BackfillPriority.LOW,
+            },
+            id="missing-everything"
+        ),
+        pytest.param(
+            _INNOVATIONS["critical"],
+            BackfillPriority.CRITICAL,
+            {
+                'funding_amount': BackfillPriority.CRITICAL,
+                'website_url': BackfillPriority.CRITICAL,
+                'founding_organization': BackfillPriority.HIGH,
+                'key_team_members': BackfillPriority.HIGH,
+                'github_url': BackfillPriority.MEDIUM,
+                'user_metrics': BackfillPriority.MEDIUM,
+                'demo_url': BackfillPriority.LOW,
+            },
+            id="missing-critical-data"
+        ),
+        pytest.param(
+            _INNOVATIONS["mostly_complete"],
+            BackfillPriority.HIGH,
+            {
+                'key_team_members': BackfillPriority.HIGH,
+                'github_url': BackfillPriority.MEDIUM,
+                'user_metrics': BackfillPriority.MEDIUM,
+                'demo_url': BackfillPriority.LOW,
+            },
+            id="mostly-complete"
+        ),
+    ])
+    async def test_missing_field_analysis(self, backfill_service, cached_missing_fields,
+                                          innovation, expected_priority, expected_fields):
+        """Test missing-field identification and the priority of the resulting job"""
         
-        # Check priorities are assigned correctly
-        funding_field = next(f for f in missing_fields if f.field_name == 'funding_amount')
-        assert funding_field.priority == BackfillPriority.CRITICAL
+        missing_fields = await cached_missing_fields(innovation)
         
-        website_field = next(f for f in missing_fields if f.field_name == 'website_url')
-        assert website_field.priority == BackfillPriority.CRITICAL
-    
-    @pytest.mark.asyncio
-    async def test_create_backfill_job(self, backfill_service, mock_innovation):
-        """Test backfill job creation"""
+        # Should identify exactly the expected fields, each with its priority
+        by_name = {field.field_name: field.priority for field in missing_fields}
+        assert by_name == expected_fields
         
-        job = await backfill_service.create_backfill_job(mock_innovation)
+        # The job takes the highest priority among its missing fields
+        job = await backfill_service.create_backfill_job(innovation)
         
         assert job is not None
-        assert job.innovation_id == 'test-innovation-123'
-        assert job.innovation_title == 'Flutterwave'
+        assert job.innovation_id == innovation['id']
+        assert job.innovation_title == innovation['title']
         assert job.status == BackfillStatus.PENDING
-        assert len(job.missing_fields) > 0
-        assert job.priority == BackfillPriority.CRITICAL  # Should have critical priority due to missing funding
+        assert [field.field_name for field in job.missing_fields] == list(by_name)
+        assert job.priority == expected_priority
     
-    @pytest.mark.asyncio
     async def test_create_perplexity_prompt(self, backfill_service):
         """Test Perplexity prompt creation for different field types"""
         
-        job = BackfillJob(
+        job = _make_job(
             job_id='test-job',
             innovation_id='test-123',
             innovation_title='Test Innovation',
-            innovation_description='A test AI innovation',
-            missing_fields=[],
-            status=BackfillStatus.PENDING,
-            priority=BackfillPriority.HIGH,
-            created_at=datetime.now()
-        )
-        
-        funding_field = MissingField(
-            field_name='funding_amount',
-            field_type='funding',
-            priority=BackfillPriority.CRITICAL,
-            search_strategy='perplexity',
-            estimated_cost=0.10
+            innovation_description='A test AI innovation'
         )
         
-        prompt = backfill_service._create_perplexity_prompt(job, funding_field)
+        prompt = backfill_service._create_perplexity_prompt(job, _FUNDING_FIELD)
         
-        assert 'Test Innovation' in prompt
-        assert 'funding' in prompt.lower()
-        assert 'investment rounds' in prompt.lower()
-        assert 'investor names' in prompt.lower()
+        assert _PROMPT_RE.search(prompt)
     
-    @pytest.mark.asyncio
     async def test_parse_with_openai_funding(self, backfill_service):
         """Test OpenAI parsing of Perplexity output for funding"""
         
@@ -125,32 +307,10 @@ class TestAIBackfillService:
         Other investors include Tiger Global and Green Visor Capital.
         """
         
-        funding_field = MissingField(
-            field_name='funding_amount',
-            field_type='funding',
-            priority=BackfillPriority.CRITICAL,
-            search_strategy='perplexity',
-            estimated_cost=0.10
-        )
-        
         # Mock OpenAI response
-        mock_response = MagicMock()
-        mock_response.choices[0].message.content = json.dumps({
-            "value": {
-                "amount": 250000000,
-                "currency": "USD",
-                "round": "Series C",
-                "investor": "Avenir Growth Capital"
-            },
-            "confidence": 0.9,
-            "supporting_evidence": ["$250 million in Series C funding", "led by Avenir Growth Capital"],
-            "source_reliability": "high",
-            "verification_notes": "Multiple sources confirm the funding amount"
-        })
+        backfill_service.openai_client = _StubOpenAI(_FUNDING_OPENAI_JSON)
         
-        backfill_service.openai_client.chat.completions.create.return_value = mock_response
-        
-        result = await backfill_service._parse_with_openai(mock_perplexity_content, funding_field)
+        result = await backfill_service._parse_with_openai(mock_perplexity_content, _FUNDING_FIELD)
         
         assert result is not None
         assert result['confidence'] == 0.9
@@ -158,26 +318,30 @@ class TestAIBackfillService:
         assert result['value']['currency'] == 'USD'
         assert result['value']['round'] == 'Series C'
     
-    @pytest.mark.asyncio
-    async def test_daily_cost_reset(self, backfill_service):
+    @pytest.fixture
+    def frozen_time(self):
+        """Pin the clock to _FIXED_NOW so date comparisons are deterministic"""
+        with freeze_time(_FIXED_NOW):
+            yield
+    
+    async def test_daily_cost_reset(self, backfill_service, frozen_time):
         """Test daily cost tracking and reset"""
         
         # Set yesterday as last reset
-        backfill_service.last_cost_reset = datetime.now().date() - timedelta(days=1)
+        backfill_service.last_cost_reset = _FIXED_NOW.date() - timedelta(days=1)
         backfill_service.current_daily_cost = 25.0
         
         # Check reset triggers
         backfill_service._check_daily_cost_reset()
         
         assert backfill_service.current_daily_cost == 0.0
-        assert backfill_service.last_cost_reset == datetime.now().date()
+        assert backfill_service.last_cost_reset == _FIXED_NOW.date()
     
-    @pytest.mark.asyncio
-    async def test_budget_limiting(self, backfill_service, mock_innovation):
+    async def test_budget_limiting(self, backfill_service, cached_missing_fields, mock_innovation):
         """Test that daily budget limits are respected"""
         
         # Set high daily cost to trigger budget limit
-        backfill_service.current_daily_cost = 49.0  # Close to $50 limit
+        backfill_service.current_daily_cost = 49.75  # Within the job's $0.50 estimate of the $50 limit
         backfill_service.daily_cost_limit = 50.0
         
         job = await backfill_service.create_backfill_job(mock_innovation)
@@ -187,51 +351,32 @@ class TestAIBackfillService:
         assert processed_job.status == BackfillStatus.SKIPPED
         assert 'cost limit' in processed_job.error_message.lower()
     
-    @pytest.mark.asyncio
-    @patch('services.ai_backfill_service.PerplexityAfricanAIModule')
-    async def test_backfill_with_perplexity_integration(self, mock_perplexity_class, backfill_service):
+    @pytest.mark.integration
+    async def test_backfill_with_perplexity_integration(self, backfill_service, monkeypatch):
         """Test integration with Perplexity API"""
         
         # Mock Perplexity module
-        mock_perplexity = AsyncMock()
-        mock_perplexity._call_perplexity_api.return_value = {
+        mock_perplexity = _StubPerplexity({
             'choices': [{
                 'message': {
                     'content': 'Flutterwave raised $250 million in Series C funding from Avenir Growth Capital.'
                 }
             }]
-        }
+        })
         
-        mock_perplexity_class.return_value.__aenter__.return_value = mock_perplexity
+        monkeypatch.setattr(backfill_service, 'perplexity_factory', lambda api_key: mock_perplexity)
         
         # Mock OpenAI parsing
-        mock_openai_response = MagicMock()
-        mock_openai_response.choices[0].message.content = json.dumps({
-            "value": {"amount": 250000000, "currency": "USD"},
-            "confidence": 0.85
-        })
-        backfill_service.openai_client.chat.completions.create.return_value = mock_openai_response
+        backfill_service.openai_client = _StubOpenAI(_FUNDING_OPENAI_JSON_SHORT)
         
-        job = BackfillJob(
+        job = _make_job(
             job_id='test-job',
             innovation_id='test-123',
             innovation_title='Flutterwave',
-            innovation_description='Fintech company',
-            missing_fields=[],
-            status=BackfillStatus.PENDING,
-            priority=BackfillPriority.HIGH,
-            created_at=datetime.now()
-        )
-        
-        funding_field = MissingField(
-            field_name='funding_amount',
-            field_type='funding',
-            priority=BackfillPriority.CRITICAL,
-            search_strategy='perplexity',
-            estimated_cost=0.10
+            innovation_description='Fintech company'
         )
         
-        result = await backfill_service._backfill_with_perplexity(job, funding_field)
+        result = await backfill_service._backfill_with_perplexity(job, _FUNDING_FIELD)
         
         assert result is not None
         assert result.field_name == 'funding_amount'
@@ -239,31 +384,23 @@ class TestAIBackfillService:
         assert result.data_source == 'perplexity_openai'
         assert result.new_value['amount'] == 250000000
     
-    @pytest.mark.asyncio
     async def test_get_backfill_stats(self, backfill_service):
         """Test backfill statistics reporting"""
         
         # Add some mock jobs
-        job1 = BackfillJob(
+        job1 = _make_job(
             job_id='job1',
             innovation_id='inn1',
             innovation_title='Test 1',
-            innovation_description='Desc 1',
-            missing_fields=[],
-            status=BackfillStatus.PENDING,
-            priority=BackfillPriority.HIGH,
-            created_at=datetime.now()
+            innovation_description='Desc 1'
         )
         
-        job2 = BackfillJob(
+        job2 = _make_job(
             job_id='job2',
             innovation_id='inn2',
             innovation_title='Test 2',
             innovation_description='Desc 2',
-            missing_fields=[],
-            status=BackfillStatus.COMPLETED,
-            priority=BackfillPriority.HIGH,
-            created_at=datetime.now()
+            status=BackfillStatus.COMPLETED
         )
         
         backfill_service.job_queue = [job1, job2]
@@ -276,28 +413,22 @@ class TestAIBackfillService:
         assert stats['completed_jobs'] == 1
         assert stats['current_daily_cost'] == 15.50
         assert stats['daily_cost_limit'] == 50.0
-        assert stats['cost_utilization'] == 31.0  # 15.50/50.0 * 100
+        assert stats['cost_utilization'] == pytest.approx(31.0, rel=1e-6)  # 15.50/50.0 * 100
 
 
 class TestBackfillJobProcessing:
     """Test backfill job processing scenarios"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="function")
     def sample_job(self):
         """Create a sample backfill job"""
-        return BackfillJob(
+        return _make_job(
             job_id='test-job-456',
             innovation_id='innovation-789',
             innovation_title='Paystack',
             innovation_description='Nigerian payment processing company',
             missing_fields=[
-                MissingField(
-                    field_name='funding_amount',
-                    field_type='funding',
-                    priority=BackfillPriority.CRITICAL,
-                    search_strategy='perplexity',
-                    estimated_cost=0.10
-                ),
+                _FUNDING_FIELD,
                 MissingField(
                     field_name='website_url',
                     field_type='urls',
@@ -306,157 +437,106 @@ class TestBackfillJobProcessing:
                     estimated_cost=0.05
                 )
             ],
-            status=BackfillStatus.PENDING,
-            priority=BackfillPriority.CRITICAL,
-            created_at=datetime.now()
+            priority=BackfillPriority.CRITICAL
         )
     
-    @pytest.mark.asyncio
-    async def test_job_lifecycle(self, sample_job):
+    async def test_job_lifecycle(self, fresh_service, sample_job, monkeypatch):
         """Test complete job processing lifecycle"""
         
-        service = AIBackfillService()
+        service = fresh_service
         
         # Mock successful processing
-        with patch.object(service, '_backfill_with_perplexity') as mock_perplexity, \
-             patch.object(service, '_backfill_with_serper') as mock_serper:
-            
-            mock_perplexity.return_value = BackfillResult(
-                innovation_id='innovation-789',
-                field_name='funding_amount',
-                old_value=None,
-                new_value={'amount': 200000000, 'currency': 'USD'},
-                confidence_score=0.8,
-                data_source='perplexity_openai',
-                validation_status='validated',
-                cost=0.10
-            )
-            
-            mock_serper.return_value = BackfillResult(
-                innovation_id='innovation-789',
-                field_name='website_url',
-                old_value=None,
-                new_value='https://paystack.com',
-                confidence_score=0.9,
-                data_source='serper',
-                validation_status='validated',
-                cost=0.05
-            )
-            
-            processed_job = await service.process_backfill_job(sample_job)
-            
-            assert processed_job.status == BackfillStatus.COMPLETED
-            assert processed_job.total_cost == 0.15
-            assert len(processed_job.results) == 2
-            assert processed_job.started_at is not None
-            assert processed_job.completed_at is not None
+        perplexity_result = BackfillResult(
+            innovation_id='innovation-789',
+            field_name='funding_amount',
+            old_value=None,
+            new_value={'amount': 200000000, 'currency': 'USD'},
+            confidence_score=0.8,
+            data_source='perplexity_openai',
+            validation_status='validated',
+            cost=0.10
+        )
+        serper_result = BackfillResult(
+            innovation_id='innovation-789',
+            field_name='website_url',
+            old_value=None,
+            new_value='https://paystack.com',
+            confidence_score=0.9,
+            data_source='serper',
+            validation_status='validated',
+            cost=0.05
+        )
+        
+        async def _perplexity(*args, **kwargs):
+            return perplexity_result
+        
+        async def _serper(*args, **kwargs):
+            return serper_result
+        
+        monkeypatch.setattr(service, '_backfill_with_perplexity', _perplexity)
+        monkeypatch.setattr(service, '_backfill_with_serper', _serper)
+        
+        processed_job = await service.process_backfill_job(sample_job)
+        
+        assert processed_job.status == BackfillStatus.COMPLETED
+        assert processed_job.total_cost == pytest.approx(0.15, rel=1e-6)
+        assert len(processed_job.results) == 2
+        assert processed_job.started_at is not None
+        assert processed_job.completed_at is not None
     
-    @pytest.mark.asyncio
-    async def test_job_failure_handling(self, sample_job):
+    async def test_job_failure_handling(self, fresh_service, sample_job, monkeypatch):
         """Test job failure scenarios"""
         
-        service = AIBackfillService()
+        service = fresh_service
         
         # Mock API failure
-        with patch.object(service, '_backfill_with_perplexity') as mock_perplexity:
-            mock_perplexity.side_effect = Exception("API Error")
-            
-            processed_job = await service.process_backfill_job(sample_job)
-            
-            assert processed_job.status == BackfillStatus.FAILED
-            assert 'API Error' in processed_job.error_message
-            assert processed_job.completed_at is not None
+        async def _failing_perplexity(*args, **kwargs):
+            raise Exception("API Error")
+        
+        monkeypatch.setattr(service, '_backfill_with_perplexity', _failing_perplexity)
+        
+        processed_job = await service.process_backfill_job(sample_job)
+        
+        assert processed_job.status == BackfillStatus.FAILED
+        assert 'API Error' in processed_job.error_message
+        assert processed_job.completed_at is not None
 
 
+@pytest.mark.integration
 class TestIntegrationScenarios:
     """Test integration scenarios with real-world data"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="function")
     def real_world_innovations(self):
         """Real-world innovation examples for testing"""
-        return [
-            {
-                'id': 'flutterwave-001',
-                'title': 'Flutterwave',
-                'description': 'Payment infrastructure for global merchants and payment service providers',
-                'innovation_type': 'FinTech',
-                'verification_status': 'verified',
-                'fundings': [],
-                'website_url': None,
-                'organizations': []
-            },
-            {
-                'id': 'mpesa-002',
-                'title': 'M-Pesa',
-                'description': 'Mobile money transfer service launched by Vodafone',
-                'innovation_type': 'FinTech',
-                'verification_status': 'verified',
-                'fundings': [{'amount': 1000000, 'currency': 'USD'}],  # Has some funding
-                'website_url': 'https://mpesa.com',  # Has website
-                'organizations': []  # Missing organizations
-            }
-        ]
+        return copy.deepcopy(_INNOVATIONS["real_world"])
     
-    @pytest.mark.asyncio
     async def test_batch_job_creation(self, real_world_innovations):
         """Test creating backfill jobs for multiple innovations"""
         
         from services.ai_backfill_service import create_backfill_jobs_for_innovations
         
+        # M-Pesa doesn't need backfilling, so only Flutterwave gets a job
+        jobs_by_id = {
+            'flutterwave-001': _make_job(
+                job_id='job1',
+                innovation_id='flutterwave-001',
+                innovation_title='Flutterwave',
+                innovation_description='Payment infrastructure',
+                priority=BackfillPriority.CRITICAL
+            )
+        }
+        
+        async def _create_backfill_job(innovation):
+            return jobs_by_id.get(innovation['id'])
+        
         with patch('services.ai_backfill_service.ai_backfill_service') as mock_service:
-            mock_service.create_backfill_job = AsyncMock()
-            mock_service.create_backfill_job.side_effect = [
-                BackfillJob(
-                    job_id='job1',
-                    innovation_id='flutterwave-001',
-                    innovation_title='Flutterwave',
-                    innovation_description='Payment infrastructure',
-                    missing_fields=[],
-                    status=BackfillStatus.PENDING,
-                    priority=BackfillPriority.CRITICAL,
-                    created_at=datetime.now()
-                ),
-                None  # M-Pesa doesn't need backfilling
-            ]
+            mock_service.create_backfill_job = _create_backfill_job
             
             jobs = await create_backfill_jobs_for_innovations(real_world_innovations)
             
             assert len(jobs) == 1
             assert jobs[0].innovation_id == 'flutterwave-001'
-    
-    @pytest.mark.asyncio
-    async def test_prioritization_logic(self):
-        """Test that jobs are prioritized correctly"""
-        
-        service = AIBackfillService()
-        
-        # Create jobs with different priorities
-        high_priority_innovation = {
-            'id': 'critical-001',
-            'title': 'Critical Innovation',
-            'description': 'Verified innovation missing critical data',
-            'verification_status': 'verified',
-            'fundings': [],  # Missing critical funding info
-            'website_url': None,  # Missing critical website
-            'organizations': []
-        }
-        
-        low_priority_innovation = {
-            'id': 'low-001',
-            'title': 'Low Priority Innovation',
-            'description': 'Innovation with most data present',
-            'verification_status': 'community',
-            'fundings': [{'amount': 100000}],  # Has funding
-            'website_url': 'https://example.com',  # Has website
-            'organizations': [{'name': 'Test Org'}],  # Has org
-            'demo_url': None  # Only missing demo URL (low priority)
-        }
-        
-        critical_job = await service.create_backfill_job(high_priority_innovation)
-        low_job = await service.create_backfill_job(low_priority_innovation)
-        
-        assert critical_job.priority == BackfillPriority.CRITICAL
-        assert low_job is None or low_job.priority.value > critical_job.priority.value
 
 
 if __name__ == "__main__":
@@ -5,18 +5,43 @@ More comprehensive search with relaxed parameters to find more African AI papers
 """
 
 import asyncio
+import json
+import os
 import re
+from collections import Counter
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Optional
 from urllib.parse import quote
 
 import aiohttp
-import feedparser
+from aiolimiter import AsyncLimiter
 from loguru import logger
+from lxml import etree
+
+try:
+    import ahocorasick
+except ImportError:
+    logger.debug("pyahocorasick not installed - using regex keyword matching")
+    ahocorasick = None
+
+try:
+    import uvloop
+except ImportError:
+    logger.debug("uvloop not installed - using the default asyncio event loop")
+    uvloop = None
 
 
 # Configuration
 ARXIV_BASE_URL = "http://export.arxiv.org/api/query"
+PAPERS_JSONL_PATH = Path(__file__).resolve().parent.parent / "data" / "arxiv_extended_papers.jsonl"
+ATOM_NS = {'a': 'http://www.w3.org/2005/Atom'}
+
+# Atom parsing helpers, compiled once. Entities are never resolved.
+_XML_PARSER = etree.XMLParser(resolve_entities=False)
+_AUTHOR_NAMES = etree.XPath('a:author/a:name/text()', namespaces=ATOM_NS, smart_strings=False)
+_CATEGORY_TERMS = etree.XPath('a:category/@term', namespaces=ATOM_NS, smart_strings=False)
 AFRICAN_COUNTRIES = [
     "Algeria", "Angola", "Benin", "Botswana", "Burkina Faso", "Burundi", 
     "Cameroon", "Cape Verde", "Central African Republic", "Chad", "Comoros", 
@@ -38,21 +63,198 @@ AFRICAN_INSTITUTIONS = [
     "Obafemi Awolowo University", "Covenant University", "Nelson Mandela University"
 ]
 
+AFRICAN_TERMS = [
+    'africa', 'african', 'sub-saharan', 'sahel', 'maghreb',
+    'east africa', 'west africa', 'north africa', 'southern africa',
+    'developing country', 'developing countries', 'low resource',
+    'resource constrained', 'global south'
+]
+
+AI_TERMS = [
+    'artificial intelligence', 'machine learning', 'deep learning',
+    'neural network', 'computer vision', 'natural language processing',
+    'nlp', 'ai', 'ml', 'dl', 'cnn', 'rnn', 'lstm', 'transformer',
+    'reinforcement learning', 'supervised learning', 'unsupervised learning',
+    'classification', 'regression', 'clustering', 'recommendation system',
+    'data mining', 'big data', 'predictive analytics', 'automation',
+    'robotics', 'expert system', 'knowledge representation',
+    'algorithm', 'computational', 'statistical', 'predictive',
+    'intelligent', 'smart', 'automated', 'learning', 'training',
+    'model', 'prediction', 'optimization', 'detection'
+]
+STRONG_AI_TERMS = frozenset(['artificial intelligence', 'machine learning', 'deep learning'])
+MEDIUM_AI_TERMS = frozenset(['ai', 'ml', 'dl'])
+
+AI_CATEGORIES = frozenset(['cs.AI', 'cs.LG', 'cs.CV', 'cs.CL', 'cs.RO', 'stat.ML', 'cs.IR', 'cs.HC', 'cs.CY'])
+
+# Lowercase fragments of author names/affiliations that suggest an African connection
+AFRICAN_NAME_PATTERNS = frozenset({'africa', 'cairo', 'lagos', 'nairobi', 'cape town', 'johannesburg'})
+_WORD_RE = re.compile(r"\w+")
+
+AI_KEYWORDS = [
+    'machine learning', 'deep learning', 'neural network', 'computer vision',
+    'natural language processing', 'reinforcement learning', 'classification',
+    'regression', 'clustering', 'recommendation', 'automation', 'robotics',
+    'algorithm', 'prediction', 'optimization', 'detection'
+]
+
+DOMAIN_KEYWORDS = [
+    'healthcare', 'agriculture', 'finance', 'education', 'transportation',
+    'energy', 'environment', 'security', 'governance', 'development',
+    'mobile', 'internet', 'social', 'economic', 'public health'
+]
+
+# Domain keywords reported as innovation domains in the scrape summary
+INNOVATION_DOMAINS = frozenset(['healthcare', 'agriculture', 'finance', 'education', 'transportation'])
+
+
+def _is_word_char(char: str) -> bool:
+    """Same notion of a word character as the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """Find every term of a keyword table occurring as a whole word in a lowercase text"""
+    
+    def __init__(self, table: List[tuple[str, float, str]]):
+        # (lowercase term, score, reported entity), in scoring order
+        self.table = table
+        self.automaton = None
+        
+        terms = [term for term, _, _ in table]
+        
+        if ahocorasick:
+            self.automaton = ahocorasick.Automaton()
+            for index, term in enumerate(terms):
+                self.automaton.add_word(term, (index, len(term)))
+            self.automaton.make_automaton()
+        
+        # Fallback: a cheap substring test, confirmed with a word-boundary regex
+        self.patterns = [re.compile(r'\b' + re.escape(term) + r'\b') for term in terms]
+    
+    def match(self, *texts: str) -> List[tuple[float, str]]:
+        """Return (score, entity) for each distinct term found in any of the texts, in table order"""
+        indexes = set()
+        
+        for text in texts:
+            if self.automaton:
+                last = len(text) - 1
+                for end, (index, length) in self.automaton.iter(text):
+                    start = end - length + 1
+                    if (start == 0 or not _is_word_char(text[start - 1])) and \
+                       (end == last or not _is_word_char(text[end + 1])):
+                        indexes.add(index)
+            else:
+                indexes.update(
+                    index for index, (term, _, _) in enumerate(self.table)
+                    if term in text and self.patterns[index].search(text)
+                )
+        
+        return [self.table[index][1:] for index in sorted(indexes)]
+
+
+# Scoring tables, built once at import
+_AFRICAN_MATCHER = KeywordMatcher(
+    [(country.lower(), 0.2, country) for country in AFRICAN_COUNTRIES] +
+    [(institution.lower(), 0.3, institution) for institution in AFRICAN_INSTITUTIONS] +
+    [(term, 0.15, term.title()) for term in AFRICAN_TERMS]
+)
+
+_AI_MATCHER = KeywordMatcher([
+    (term, 0.25 if term in STRONG_AI_TERMS else 0.15 if term in MEDIUM_AI_TERMS else 0.05, term)
+    for term in AI_TERMS
+])
+
+_KEYWORD_MATCHER = KeywordMatcher(
+    [(keyword, 0.0, keyword.title()) for keyword in AI_KEYWORDS + DOMAIN_KEYWORDS]
+)
+
+
+@dataclass(slots=True)
+class ExtendedArxivPaper:
+    """Scored ArXiv paper; slotted to keep large scrapes compact in memory"""
+    arxiv_id: str
+    title: str
+    authors: List[str]
+    abstract: str
+    url: str
+    published_date: datetime
+    updated_date: datetime
+    categories: List[str]
+    keywords: List[str]
+    african_relevance_score: float
+    african_entities: List[str]
+    ai_relevance_score: float
+
 
 class ExtendedArxivScraper:
     """Extended ArXiv scraper with broader search parameters"""
     
+    MAX_CONCURRENT_REQUESTS = 4
+    # ArXiv asks API clients for no more than one request every three seconds
+    REQUEST_INTERVAL_SECONDS = 3
+    # Validators and bodies of earlier responses, so unchanged queries cost a 304
+    ETAG_CACHE_PATH = Path.home() / '.cache' / 'taifa' / 'arxiv_etags.json'
+    # Transient failures are retried with exponential backoff
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    MAX_RETRIES = 3
+    
     def __init__(self):
         self.session = None
+        self.semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self.limiter = AsyncLimiter(1, self.REQUEST_INTERVAL_SECONDS)
+        self._etags: Dict[str, Dict[str, Optional[str]]] = {}
+        self._etags_dirty = False
+        # ArXiv IDs already parsed during the current scrape
+        self._seen_ids: set[str] = set()
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        # One pooled connector sized to the concurrency cap, so every query after
+        # the first reuses a warm keep-alive connection to export.arxiv.org
+        connector = aiohttp.TCPConnector(
+            limit=2 * self.MAX_CONCURRENT_REQUESTS,
+            limit_per_host=self.MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={'Accept-Encoding': 'gzip'}
+        )
+        self._etags = await asyncio.to_thread(self._load_etag_cache)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._etags_dirty:
+            await asyncio.to_thread(self._save_etag_cache)
         if self.session:
             await self.session.close()
     
+    def _load_etag_cache(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Read cached response validators, ignoring a missing or unreadable file"""
+        try:
+            with open(self.ETAG_CACHE_PATH, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ArXiv ETag cache: {e}")
+            return {}
+    
+    def _save_etag_cache(self):
+        """Write cached response validators atomically"""
+        try:
+            self.ETAG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.ETAG_CACHE_PATH.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._etags, f)
+            os.replace(tmp_path, self.ETAG_CACHE_PATH)
+            self._etags_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save ArXiv ETag cache: {e}")
+    
     def build_search_queries(self, max_results: int = 200, days_back: int = 365) -> List[str]:
         """Build multiple search queries to maximize paper discovery"""
         queries = []
@@ -69,22 +271,22 @@ class ExtendedArxivScraper:
             url = f"{ARXIV_BASE_URL}?search_query={quote(query)}&start=0&max_results={max_results//4}&sortBy=lastUpdatedDate&sortOrder=descending"
             queries.append(url)
         
-        # Strategy 2: Major African countries + tech terms
+        # Strategy 2: Major African countries + tech terms, as one OR-query
         major_countries = ["South Africa", "Nigeria", "Kenya", "Egypt", "Ghana", "Morocco"]
         tech_terms = ["AI", "machine learning", "technology", "innovation"]
         
-        for country in major_countries[:3]:
-            for tech_term in tech_terms[:2]:
-                query = f'all:"{country}" AND all:"{tech_term}"'
-                url = f"{ARXIV_BASE_URL}?search_query={quote(query)}&start=0&max_results=25&sortBy=lastUpdatedDate&sortOrder=descending"
-                queries.append(url)
+        countries_clause = ' OR '.join(f'all:"{country}"' for country in major_countries[:3])
+        tech_clause = ' OR '.join(f'all:"{tech_term}"' for tech_term in tech_terms[:2])
+        query = f'({countries_clause}) AND ({tech_clause})'
+        url = f"{ARXIV_BASE_URL}?search_query={quote(query)}&start=0&max_results=150&sortBy=lastUpdatedDate&sortOrder=descending"
+        queries.append(url)
         
-        # Strategy 3: African universities + CS categories
+        # Strategy 3: African universities + CS categories, as one OR-query
         universities = ["University of Cape Town", "University of Witwatersrand", "Cairo University"]
-        for university in universities:
-            query = f'all:"{university}" AND (cat:cs.AI OR cat:cs.LG OR cat:cs.CV OR cat:cs.CL)'
-            url = f"{ARXIV_BASE_URL}?search_query={quote(query)}&start=0&max_results=30&sortBy=lastUpdatedDate&sortOrder=descending"
-            queries.append(url)
+        universities_clause = ' OR '.join(f'all:"{university}"' for university in universities)
+        query = f'({universities_clause}) AND (cat:cs.AI OR cat:cs.LG OR cat:cs.CV OR cat:cs.CL)'
+        url = f"{ARXIV_BASE_URL}?search_query={quote(query)}&start=0&max_results=90&sortBy=lastUpdatedDate&sortOrder=descending"
+        queries.append(url)
         
         # Strategy 4: Development + AI
         development_terms = [
@@ -100,32 +302,82 @@ class ExtendedArxivScraper:
         
         return queries
     
-    async def fetch_papers(self, query_url: str) -> List[Dict[str, Any]]:
+    async def fetch_papers(self, query_url: str) -> List[ExtendedArxivPaper]:
         """Fetch papers from ArXiv API"""
         try:
-            logger.info(f"Fetching from: {query_url[:100]}...")
-            async with self.session.get(query_url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    return self.parse_arxiv_response(content)
-                else:
-                    logger.error(f"ArXiv API error: {response.status}")
-                    return []
+            # Revalidate against the last response we saw for this query
+            headers = {}
+            cached = self._etags.get(query_url)
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            for attempt in range(self.MAX_RETRIES + 1):
+                try:
+                    async with self.semaphore, self.limiter:
+                        logger.info(f"Fetching from: {query_url[:100]}...")
+                        async with self.session.get(query_url, headers=headers) as response:
+                            if response.status == 304 and cached:
+                                logger.info("ArXiv query unchanged since last run, reusing cached response")
+                                content = cached['body'].encode('utf-8')
+                                break
+                            
+                            if response.status == 200:
+                                content = await response.read()
+                                etag = response.headers.get('ETag')
+                                last_modified = response.headers.get('Last-Modified')
+                                if etag or last_modified:
+                                    self._etags[query_url] = {
+                                        'etag': etag,
+                                        'last_modified': last_modified,
+                                        'body': content.decode('utf-8')
+                                    }
+                                    self._etags_dirty = True
+                                break
+                            
+                            if response.status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                                logger.error(f"ArXiv API error: {response.status}")
+                                return []
+                            
+                            try:
+                                retry_after = float(response.headers.get('Retry-After', 2 ** attempt))
+                            except ValueError:
+                                retry_after = 2 ** attempt
+                            logger.warning(f"ArXiv returned {response.status}, retrying in {retry_after:.1f}s")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt == self.MAX_RETRIES:
+                        raise
+                    retry_after = 2 ** attempt
+                    logger.warning(f"ArXiv connection failed ({e!r}), retrying in {retry_after:.1f}s")
+                
+                # Back off outside the semaphore so other queries keep their slots
+                await asyncio.sleep(retry_after)
+            
+            return self.parse_arxiv_response(content)
         except Exception as e:
             logger.error(f"Error fetching from ArXiv: {e}")
             return []
     
-    def parse_arxiv_response(self, xml_content: str) -> List[Dict[str, Any]]:
-        """Parse ArXiv XML response"""
+    def parse_arxiv_response(self, xml_bytes: bytes) -> List[ExtendedArxivPaper]:
+        """Parse ArXiv XML response from the raw body bytes"""
         papers = []
         
         try:
-            # Use feedparser to parse Atom feed
-            feed = feedparser.parse(xml_content)
-            logger.info(f"Parsing {len(feed.entries)} entries from ArXiv")
+            # lxml decodes using the XML declaration, so the body is never decoded in Python
+            root = etree.fromstring(xml_bytes, _XML_PARSER)
+            entries = root.findall('a:entry', ATOM_NS)
+            logger.info(f"Parsing {len(entries)} entries from ArXiv")
             
-            for entry in feed.entries:
+            for entry in entries:
                 try:
+                    # Queries overlap heavily; skip papers another query already returned
+                    arxiv_id = entry.findtext('a:id', '', ATOM_NS).split('/')[-1]
+                    if arxiv_id in self._seen_ids:
+                        continue
+                    self._seen_ids.add(arxiv_id)
+                    
                     paper_data = self.extract_paper_data(entry)
                     if paper_data:
                         papers.append(paper_data)
@@ -138,228 +390,220 @@ class ExtendedArxivScraper:
             
         return papers
     
-    def extract_paper_data(self, entry) -> Optional[Dict[str, Any]]:
-        """Extract paper data from ArXiv entry"""
+    def extract_paper_data(self, entry: etree._Element) -> Optional[ExtendedArxivPaper]:
+        """Extract paper data from an Atom <entry> element"""
         try:
             # Extract basic information
-            title = entry.title.replace('\n', ' ').strip()
-            abstract = entry.summary.replace('\n', ' ').strip()
+            title = entry.findtext('a:title', '', ATOM_NS).replace('\n', ' ').strip()
+            abstract = entry.findtext('a:summary', '', ATOM_NS).replace('\n', ' ').strip()
             
             # Extract ArXiv ID from URL
-            arxiv_id = entry.id.split('/')[-1]
+            entry_id = entry.findtext('a:id', '', ATOM_NS)
+            arxiv_id = entry_id.split('/')[-1]
             
             # Extract authors
-            authors = []
-            if hasattr(entry, 'authors'):
-                authors = [author.name for author in entry.authors]
-            elif hasattr(entry, 'author'):
-                authors = [entry.author]
+            authors = _AUTHOR_NAMES(entry)
             
             # Extract dates
-            published_date = datetime.strptime(entry.published, '%Y-%m-%dT%H:%M:%SZ')
-            updated_date = datetime.strptime(entry.updated, '%Y-%m-%dT%H:%M:%SZ')
+            # ArXiv timestamps are ISO 8601 UTC ("2024-03-05T10:00:00Z"); keep them naive as before
+            published_date = datetime.fromisoformat(entry.findtext('a:published', '', ATOM_NS).removesuffix('Z'))
+            updated_date = datetime.fromisoformat(entry.findtext('a:updated', '', ATOM_NS).removesuffix('Z'))
             
             # Extract categories
-            categories = []
-            if hasattr(entry, 'tags'):
-                categories = [tag.term for tag in entry.tags]
+            categories = _CATEGORY_TERMS(entry)
+            
+            # Lowercase the searchable text once for every scorer
+            text_lower = ' '.join((title, abstract)).lower()
+            authors_lower = [author.lower() for author in authors]
             
             # Calculate relevance scores (more lenient)
-            african_score, african_entities = self.calculate_african_relevance(title, abstract, authors)
-            ai_score = self.calculate_ai_relevance(title, abstract, categories)
+            african_score, african_entities = self.calculate_african_relevance(text_lower, authors_lower)
+            ai_score = self.calculate_ai_relevance(text_lower, categories)
             
             # Extract keywords from title and abstract
-            keywords = self.extract_keywords(title, abstract)
+            keywords = self.extract_keywords(text_lower)
             
-            return {
-                'arxiv_id': arxiv_id,
-                'title': title,
-                'authors': authors,
-                'abstract': abstract,
-                'url': entry.id,
-                'published_date': published_date,
-                'updated_date': updated_date,
-                'categories': categories,
-                'keywords': keywords,
-                'african_relevance_score': african_score,
-                'african_entities': african_entities,
-                'ai_relevance_score': ai_score
-            }
+            return ExtendedArxivPaper(
+                arxiv_id=arxiv_id,
+                title=title,
+                authors=authors,
+                abstract=abstract,
+                url=entry_id,
+                published_date=published_date,
+                updated_date=updated_date,
+                categories=categories,
+                keywords=keywords,
+                african_relevance_score=african_score,
+                african_entities=african_entities,
+                ai_relevance_score=ai_score
+            )
             
         except Exception as e:
             logger.error(f"Error extracting paper data: {e}")
             return None
     
-    def calculate_african_relevance(self, title: str, abstract: str, authors: List[str]) -> tuple[float, List[str]]:
-        """Calculate African relevance score (more lenient)"""
-        text = f"{title} {abstract} {' '.join(authors)}".lower()
-        
+    def calculate_african_relevance(self, text_lower: str, authors_lower: List[str]) -> tuple[float, List[str]]:
+        """Calculate African relevance score (more lenient) from lowercase title/abstract and authors"""
         found_entities = []
         score = 0.0
         
-        # Check for African countries
-        for country in AFRICAN_COUNTRIES:
-            if country.lower() in text:
-                found_entities.append(country)
-                score += 0.2  # Reduced from 0.3
-        
-        # Check for African institutions
-        for institution in AFRICAN_INSTITUTIONS:
-            if institution.lower() in text:
-                found_entities.append(institution)
-                score += 0.3  # Reduced from 0.4
-        
-        # Check for African-specific terms
-        african_terms = [
-            'africa', 'african', 'sub-saharan', 'sahel', 'maghreb',
-            'east africa', 'west africa', 'north africa', 'southern africa',
-            'developing country', 'developing countries', 'low resource',
-            'resource constrained', 'global south'
-        ]
-        
-        for term in african_terms:
-            if term in text:
-                score += 0.15  # Reduced from 0.2
-                found_entities.append(term.title())
+        # Check for African countries, institutions and African-specific terms
+        for term_score, entity in _AFRICAN_MATCHER.match(text_lower, *authors_lower):
+            score += term_score
+            found_entities.append(entity)
         
         # Check author affiliations more broadly
-        for author in authors:
-            author_lower = author.lower()
-            # Look for African patterns in names or affiliations
-            african_name_patterns = ['africa', 'cairo', 'lagos', 'nairobi', 'cape town', 'johannesburg']
-            for pattern in african_name_patterns:
-                if pattern in author_lower:
-                    score += 0.25
-                    found_entities.append(f"Author: {pattern.title()}")
+        for author_lower in authors_lower:
+            # Words plus adjacent pairs, so two-word places like "cape town" still match
+            words = _WORD_RE.findall(author_lower)
+            tokens = set(words)
+            tokens.update(' '.join(pair) for pair in zip(words, words[1:]))
+            
+            for pattern in AFRICAN_NAME_PATTERNS & tokens:
+                score += 0.25
+                found_entities.append(f"Author: {pattern.title()}")
         
         return min(score, 1.0), list(set(found_entities))
     
-    def calculate_ai_relevance(self, title: str, abstract: str, categories: List[str]) -> float:
-        """Calculate AI relevance score (more lenient)"""
-        text = f"{title} {abstract}".lower()
-        
-        ai_terms = [
-            'artificial intelligence', 'machine learning', 'deep learning',
-            'neural network', 'computer vision', 'natural language processing',
-            'nlp', 'ai', 'ml', 'dl', 'cnn', 'rnn', 'lstm', 'transformer',
-            'reinforcement learning', 'supervised learning', 'unsupervised learning',
-            'classification', 'regression', 'clustering', 'recommendation system',
-            'data mining', 'big data', 'predictive analytics', 'automation',
-            'robotics', 'expert system', 'knowledge representation',
-            'algorithm', 'computational', 'statistical', 'predictive',
-            'intelligent', 'smart', 'automated', 'learning', 'training',
-            'model', 'prediction', 'optimization', 'detection'
-        ]
-        
+    def calculate_ai_relevance(self, text_lower: str, categories: List[str]) -> float:
+        """Calculate AI relevance score (more lenient) from lowercase title/abstract"""
+        # Scores only grow, so stop as soon as the 1.0 cap is reached
         score = 0.0
-        for term in ai_terms:
-            if term in text:
-                if term in ['artificial intelligence', 'machine learning', 'deep learning']:
-                    score += 0.25  # Reduced from 0.3
-                elif term in ['ai', 'ml', 'dl']:
-                    score += 0.15  # Reduced from 0.2
-                else:
-                    score += 0.05  # Reduced from 0.1
+        for term_score, _ in _AI_MATCHER.match(text_lower):
+            score += term_score
+            if score >= 1.0:
+                return 1.0
         
         # Check categories (more lenient)
-        ai_categories = ['cs.AI', 'cs.LG', 'cs.CV', 'cs.CL', 'cs.RO', 'stat.ML', 'cs.IR', 'cs.HC', 'cs.CY']
         for cat in categories:
-            if cat in ai_categories:
+            if cat in AI_CATEGORIES:
                 score += 0.3
+                if score >= 1.0:
+                    return 1.0
         
-        return min(score, 1.0)
+        return score
     
-    def extract_keywords(self, title: str, abstract: str) -> List[str]:
-        """Extract keywords from title and abstract"""
-        text = f"{title} {abstract}".lower()
-        
-        keywords = []
-        
-        # AI keywords
-        ai_keywords = [
-            'machine learning', 'deep learning', 'neural network', 'computer vision',
-            'natural language processing', 'reinforcement learning', 'classification',
-            'regression', 'clustering', 'recommendation', 'automation', 'robotics',
-            'algorithm', 'prediction', 'optimization', 'detection'
-        ]
-        
-        for keyword in ai_keywords:
-            if keyword in text:
-                keywords.append(keyword.title())
-        
-        # Domain-specific keywords
-        domain_keywords = [
-            'healthcare', 'agriculture', 'finance', 'education', 'transportation',
-            'energy', 'environment', 'security', 'governance', 'development',
-            'mobile', 'internet', 'social', 'economic', 'public health'
-        ]
-        
-        for keyword in domain_keywords:
-            if keyword in text:
-                keywords.append(keyword.title())
+    def extract_keywords(self, text_lower: str) -> List[str]:
+        """Extract keywords from lowercase title/abstract"""
+        # AI and domain-specific keywords
+        keywords = [keyword for _, keyword in _KEYWORD_MATCHER.match(text_lower)]
         
         return list(set(keywords))
     
-    async def scrape_papers_extended(self, max_results: int = 300) -> List[Dict[str, Any]]:
-        """Extended paper scraping with multiple strategies"""
+    async def _write_jsonl(self, queue: asyncio.Queue, output_path: Path):
+        """Append queued papers to a JSONL file until a None sentinel arrives"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            done = False
+            while not done:
+                # Write whatever has queued up in one call off the event loop
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                if batch[-1] is None:
+                    batch.pop()
+                    done = True
+                
+                lines = ''.join(json.dumps(asdict(paper), default=str) + '\n' for paper in batch)
+                await asyncio.to_thread(f.write, lines)
+        
+        logger.info(f"Wrote scraped papers to {output_path}")
+    
+    async def scrape_papers_extended(self, max_results: int = 300,
+                                     output_path: Optional[Path] = None) -> List[ExtendedArxivPaper]:
+        """Extended paper scraping with multiple strategies
+        
+        If output_path is given, relevant papers are also streamed to it as JSONL
+        as each query finishes, so the results survive an interrupted run.
+        """
         logger.info(f"Starting extended ArXiv scrape...")
         
         all_papers = []
+        self._seen_ids.clear()
         queries = self.build_search_queries(max_results)
         
+        queue = None
+        writer = None
+        if output_path:
+            queue = asyncio.Queue(maxsize=1000)
+            writer = asyncio.create_task(self._write_jsonl(queue, output_path))
+        
         logger.info(f"Running {len(queries)} different search queries...")
         
-        for i, query_url in enumerate(queries, 1):
-            try:
-                logger.info(f"Query {i}/{len(queries)}: Searching...")
-                papers = await self.fetch_papers(query_url)
-                
-                # Filter with more lenient criteria
-                relevant_papers = []
-                for paper in papers:
-                    african_score = paper['african_relevance_score']
-                    ai_score = paper['ai_relevance_score']
-                    
-                    # More lenient filtering
-                    if (african_score >= 0.15 and ai_score >= 0.1) or \
-                       (african_score >= 0.3) or \
-                       (ai_score >= 0.4 and african_score >= 0.05):
-                        relevant_papers.append(paper)
-                
-                all_papers.extend(relevant_papers)
-                logger.info(f"   Found {len(relevant_papers)} relevant papers")
-                
-                # Rate limiting
-                await asyncio.sleep(3)
+        async def run_query(i: int, query_url: str) -> List[ExtendedArxivPaper]:
+            logger.info(f"Query {i}/{len(queries)}: Searching...")
+            papers = await self.fetch_papers(query_url)
+            
+            # Filter with more lenient criteria
+            relevant_papers = []
+            for paper in papers:
+                african_score = paper.african_relevance_score
+                ai_score = paper.ai_relevance_score
                 
-            except Exception as e:
-                logger.error(f"Error in query {i}: {e}")
-                continue
+                # More lenient filtering
+                if (african_score >= 0.15 and ai_score >= 0.1) or \
+                   (african_score >= 0.3) or \
+                   (ai_score >= 0.4 and african_score >= 0.05):
+                    relevant_papers.append(paper)
+            
+            logger.info(f"   Query {i}: found {len(relevant_papers)} relevant papers")
+            if queue:
+                for paper in relevant_papers:
+                    await queue.put(paper)
+            return relevant_papers
+        
+        # Queries run concurrently; fetch_papers enforces the concurrency and rate limits
+        producers = asyncio.gather(
+            *(run_query(i, query_url) for i, query_url in enumerate(queries, 1)),
+            return_exceptions=True
+        )
         
-        # Remove duplicates
-        unique_papers = {}
-        for paper in all_papers:
-            if paper['arxiv_id'] not in unique_papers:
-                unique_papers[paper['arxiv_id']] = paper
+        if writer:
+            # Nothing drains the queue once the writer dies, so a failed writer cancels the queries
+            # rather than leaving them blocked on a full queue
+            writer.add_done_callback(
+                lambda task: producers.cancel() if not task.cancelled() and task.exception() else None
+            )
         
-        result_papers = list(unique_papers.values())
+        try:
+            results = await producers
+        except asyncio.CancelledError:
+            if writer and writer.done() and not writer.cancelled() and writer.exception():
+                raise writer.exception()
+            raise
+        
+        if writer:
+            await queue.put(None)
+            await writer
+        
+        for i, result in enumerate(results, 1):
+            if isinstance(result, Exception):
+                logger.error(f"Error in query {i}: {result}")
+                continue
+            all_papers.extend(result)
         
+        # No dedup pass needed: papers seen by an earlier query were skipped while parsing
         # Sort by relevance score
-        result_papers.sort(
-            key=lambda p: p['african_relevance_score'] * 0.6 + p['ai_relevance_score'] * 0.4,
+        all_papers.sort(
+            key=lambda p: p.african_relevance_score * 0.6 + p.ai_relevance_score * 0.4,
             reverse=True
         )
         
-        logger.info(f"Found {len(result_papers)} unique relevant papers")
-        return result_papers
+        logger.info(f"Found {len(all_papers)} unique relevant papers")
+        return all_papers
 
 
-async def test_extended_arxiv():
-    """Test extended ArXiv scraping"""
+async def test_extended_arxiv(output_path: Optional[Path] = None):
+    """Test extended ArXiv scraping
+    
+    Papers are only written out as JSONL when an output_path is given; running
+    the module as a script saves them to PAPERS_JSONL_PATH.
+    """
     logger.info("🚀 Starting Extended ArXiv Academic ETL Test...")
     
     async with ExtendedArxivScraper() as scraper:
-        papers = await scraper.scrape_papers_extended(max_results=500)
+        papers = await scraper.scrape_papers_extended(max_results=500, output_path=output_path)
         
         logger.info(f"✅ Successfully scraped {len(papers)} papers")
         
@@ -367,25 +611,25 @@ async def test_extended_arxiv():
             # Show top papers
             logger.info("\n📄 Top African AI Papers Found:")
             for i, paper in enumerate(papers[:10], 1):
-                logger.info(f"\n{i}. {paper['title']}")
-                logger.info(f"   Authors: {', '.join(paper['authors'][:3])}{'...' if len(paper['authors']) > 3 else ''}")
-                logger.info(f"   Published: {paper['published_date'].strftime('%Y-%m-%d')}")
-                logger.info(f"   African Score: {paper['african_relevance_score']:.2f}")
-                logger.info(f"   AI Score: {paper['ai_relevance_score']:.2f}")
-                logger.info(f"   African Entities: {paper['african_entities']}")
-                logger.info(f"   Keywords: {paper['keywords']}")
-                logger.info(f"   Categories: {paper['categories']}")
-                logger.info(f"   URL: {paper['url']}")
-                logger.info(f"   Abstract: {paper['abstract'][:300]}...")
+                logger.info(f"\n{i}. {paper.title}")
+                logger.info(f"   Authors: {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}")
+                logger.info(f"   Published: {paper.published_date.strftime('%Y-%m-%d')}")
+                logger.info(f"   African Score: {paper.african_relevance_score:.2f}")
+                logger.info(f"   AI Score: {paper.ai_relevance_score:.2f}")
+                logger.info(f"   African Entities: {paper.african_entities}")
+                logger.info(f"   Keywords: {paper.keywords}")
+                logger.info(f"   Categories: {paper.categories}")
+                logger.info(f"   URL: {paper.url}")
+                logger.info(f"   Abstract: {paper.abstract[:300]}...")
                 logger.info("-" * 100)
         
         # Show comprehensive statistics
         if papers:
-            avg_african_score = sum(p['african_relevance_score'] for p in papers) / len(papers)
-            avg_ai_score = sum(p['ai_relevance_score'] for p in papers) / len(papers)
+            avg_african_score = sum(p.african_relevance_score for p in papers) / len(papers)
+            avg_ai_score = sum(p.ai_relevance_score for p in papers) / len(papers)
             
             # High relevance papers
-            high_relevance = [p for p in papers if p['african_relevance_score'] >= 0.5 and p['ai_relevance_score'] >= 0.3]
+            high_relevance = [p for p in papers if p.african_relevance_score >= 0.5 and p.ai_relevance_score >= 0.3]
             
             logger.info(f"\n📊 Comprehensive Statistics:")
             logger.info(f"   Total Papers: {len(papers)}")
@@ -394,40 +638,27 @@ async def test_extended_arxiv():
             logger.info(f"   Average AI Relevance: {avg_ai_score:.3f}")
             
             # Year distribution
-            years = {}
-            for paper in papers:
-                year = paper['published_date'].year
-                years[year] = years.get(year, 0) + 1
+            years = Counter(paper.published_date.year for paper in papers)
             
             logger.info(f"   Year Distribution: {dict(sorted(years.items(), reverse=True))}")
             
             # Category distribution
-            categories = {}
-            for paper in papers:
-                for cat in paper['categories']:
-                    categories[cat] = categories.get(cat, 0) + 1
+            categories = Counter(cat for paper in papers for cat in paper.categories)
             
-            logger.info(f"   Top Categories: {dict(list(sorted(categories.items(), key=lambda x: x[1], reverse=True))[:10])}")
+            logger.info(f"   Top Categories: {dict(categories.most_common(10))}")
             
             # African entity distribution
-            all_entities = []
-            for paper in papers:
-                all_entities.extend(paper['african_entities'])
+            entity_count = Counter(entity for paper in papers for entity in paper.african_entities)
             
-            entity_count = {}
-            for entity in all_entities:
-                entity_count[entity] = entity_count.get(entity, 0) + 1
-            
-            logger.info(f"   Top African Entities: {dict(list(sorted(entity_count.items(), key=lambda x: x[1], reverse=True))[:10])}")
+            logger.info(f"   Top African Entities: {dict(entity_count.most_common(10))}")
             
             # Innovation types based on keywords
-            innovation_types = {}
-            for paper in papers:
-                for keyword in paper['keywords']:
-                    if keyword.lower() in ['healthcare', 'agriculture', 'finance', 'education', 'transportation']:
-                        innovation_types[keyword] = innovation_types.get(keyword, 0) + 1
+            innovation_types = Counter(
+                keyword for paper in papers for keyword in paper.keywords
+                if keyword.lower() in INNOVATION_DOMAINS
+            )
             
-            logger.info(f"   Innovation Domains: {dict(sorted(innovation_types.items(), key=lambda x: x[1], reverse=True))}")
+            logger.info(f"   Innovation Domains: {dict(innovation_types.most_common())}")
         
         return papers
 
@@ -435,7 +666,9 @@ async def test_extended_arxiv():
 if __name__ == "__main__":
     logger.info("🔬 TAIFA-FIALA Extended Academic ETL Test Starting...")
     
-    papers = asyncio.run(test_extended_arxiv())
+    # uvloop's libuv-based loop schedules the many small HTTP requests faster when available
+    run = uvloop.run if uvloop else asyncio.run
+    papers = run(test_extended_arxiv(output_path=PAPERS_JSONL_PATH))
     
     logger.info("🏁 Extended Academic ETL test completed!")
     
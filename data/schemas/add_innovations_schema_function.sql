@@ -0,0 +1,28 @@
+-- Migration: Add innovations_schema() introspection function
+-- Description: Returns the innovations table's column metadata in a single RPC call,
+-- so integration checks no longer sample a row and probe with a test insert/delete
+
+CREATE OR REPLACE FUNCTION innovations_schema()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT COALESCE(
+        jsonb_agg(
+            jsonb_build_object(
+                'column_name', column_name,
+                'data_type', data_type,
+                'is_nullable', is_nullable = 'YES',
+                'has_default', column_default IS NOT NULL
+            )
+            ORDER BY ordinal_position
+        ),
+        '[]'::jsonb
+    )
+    FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = 'innovations';
+$$;
+
+-- Verify the function returns the column list
+SELECT jsonb_array_length(innovations_schema()) AS innovations_column_count;
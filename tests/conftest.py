@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the integration scripts when they run under pytest
+
+Every test runs on one session-scoped event loop, so module-level clients and their
+connection pools (the memoized Pinecone client, the Supabase HTTP/2 client) are set up
+once and reused across modules.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path, as the scripts themselves do
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+
+def pytest_configure(config):
+    # Same default as backend/pytest.ini: tests that talk to the live services only run with -m integration
+    config.addinivalue_line("markers", "integration: talks to the live Supabase/Pinecone services")
+    if not config.option.markexpr:
+        config.option.markexpr = "not integration"
+
+
+@pytest.fixture(scope="session")
+def etl_monitor_harness():
+    """The process-wide ETL monitor that ETLJobContext reports to"""
+    from services.etl_monitor import etl_monitor
+
+    return etl_monitor
@@ -20,16 +20,63 @@ from datetime import datetime
 from uuid import uuid4
 from typing import Dict, Any, List
 import json
+from collections import Counter
+from types import MappingProxyType
 
 # Add backend directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import settings
-from config.database import get_supabase, get_db
+from config.database import get_supabase, AsyncSessionLocal, bulk_insert_innovations, delete_innovations
 from services.vector_service import get_vector_service, VectorDocument
 # from models.database import Innovation, Organization, Publication
 from sqlalchemy.orm import Session
 
+# Fields shared by every innovation row the tester writes
+_INNOVATION_TEMPLATE = MappingProxyType({
+    "verification_status": "pending",
+    "visibility": "public",
+    "source_type": "integration_test",
+})
+
+RESULTS_LOG_PATH = 'integration_test_results.jsonl'
+RESULTS_SUMMARY_PATH = 'integration_test_results.json'
+
+_FULL_TEXT_DOCUMENTS = [
+    {
+        "title": "Mobile Health App for Rural Tanzania",
+        "description": "A comprehensive mobile application that uses AI to provide healthcare diagnostics and treatment recommendations for rural communities in Tanzania. The app leverages machine learning algorithms trained on local health data to provide culturally appropriate medical advice.",
+        "type": "HealthTech",
+        "country": "Tanzania"
+    },
+    {
+        "title": "Agricultural Yield Prediction System",
+        "description": "Deep learning system that analyzes satellite imagery, weather patterns, and soil data to predict crop yields for smallholder farmers across West Africa. The system provides early warnings for potential crop failures and optimization recommendations.",
+        "type": "AgriTech",
+        "country": "Ghana"
+    },
+    {
+        "title": "Financial Inclusion Platform",
+        "description": "Blockchain-based microfinance platform that uses natural language processing to assess creditworthiness from alternative data sources including mobile money transactions and social media activity for unbanked populations in Kenya.",
+        "type": "FinTech",
+        "country": "Kenya"
+    }
+]
+
+_FULL_TEXT_QUERIES = [
+    "healthcare mobile app Tanzania",
+    "crop prediction satellite imagery",
+    "microfinance blockchain Kenya",
+    "AI for agriculture West Africa"
+]
+
+def _full_text(doc_data: Dict[str, Any]) -> str:
+    return f"{doc_data['title']}. {doc_data['description']}"
+
+async def _sb(call):
+    """Run a blocking Supabase call in a worker thread so other pending I/O keeps progressing"""
+    return await asyncio.to_thread(call)
+
 class IntegrationTester:
     """Comprehensive integration tester for TAIFA-FIALA services"""
 
@@ -37,12 +84,21 @@ class IntegrationTester:
         self.supabase = None
         self.vector_service = None
         self.db_session = None
-        self.test_results = []
+        # Rows and vectors written by the tests, removed together in teardown()
+        self._created_ids = []
+        self._created_vector_ids = []
+        # Results stream to RESULTS_LOG_PATH as they are logged; only counts and failures stay in memory
+        self._log_fh = None
+        self.total_tests = 0
+        self.passed_tests = 0
+        self.failed_results = []
 
     async def initialize(self):
         """Initialize all services"""
         print("🔧 Initializing integration test services...")
 
+        self._log_fh = open(RESULTS_LOG_PATH, 'w')
+
         try:
             # Initialize Supabase client
             self.supabase = get_supabase()
@@ -53,7 +109,7 @@ class IntegrationTester:
             print("✅ Pinecone vector service initialized")
 
             # Get database session
-            self.db_session = next(get_db())
+            self.db_session = AsyncSessionLocal()
             print("✅ Database session established")
 
         except Exception as e:
@@ -67,12 +123,48 @@ class IntegrationTester:
         if details:
             print(f"    Details: {details}")
 
-        self.test_results.append({
+        record = {
             "test": test_name,
             "passed": passed,
             "details": details,
             "timestamp": datetime.now().isoformat()
-        })
+        }
+        if self._log_fh:
+            self._log_fh.write(json.dumps(record) + '\n')
+            self._log_fh.flush()
+
+        self.total_tests += 1
+        if passed:
+            self.passed_tests += 1
+        else:
+            self.failed_results.append(record)
+
+    async def prefetch_full_text_embeddings(self):
+        """Embed the full-text test documents and queries ahead of test_full_text_vectorization"""
+        texts = [self.vector_service.prepare_text(_full_text(doc_data)) for doc_data in _FULL_TEXT_DOCUMENTS]
+        await self.vector_service.embed_texts(texts + _FULL_TEXT_QUERIES)
+
+    async def teardown(self):
+        """Remove everything the tests wrote with one batched delete per backend"""
+        row_ids, self._created_ids = self._created_ids, []
+        vector_ids, self._created_vector_ids = self._created_vector_ids, []
+
+        cleanups = []
+        if row_ids and self.supabase:
+            cleanups.append(_sb(lambda: delete_innovations(row_ids)))
+        if vector_ids and self.vector_service:
+            cleanups.append(self.vector_service.delete_documents(vector_ids))
+        if cleanups:
+            await asyncio.gather(*cleanups)
+            print(f"🧹 Cleaned up {len(row_ids)} test rows and {len(vector_ids)} test vectors")
+
+    async def close(self):
+        """Close the streamed results log and the database session"""
+        if self._log_fh:
+            self._log_fh.close()
+            self._log_fh = None
+        if self.db_session:
+            await self.db_session.close()
 
     async def test_pinecone_connection(self):
         """Test Pinecone vector database connection and basic operations"""
@@ -85,9 +177,9 @@ class IntegrationTester:
 
             # Test embedding generation
             test_text = "AI-powered crop disease detection using computer vision in Kenya"
-            embedding = self.vector_service.generate_embedding(test_text)
+            embedding = await self.vector_service.embed_text(test_text)
 
-            expected_dimension = settings.EMBEDDING_DIMENSION
+            expected_dimension = stats.get('dimension', 1024)
             actual_dimension = len(embedding)
 
             self.log_test(
@@ -108,6 +200,7 @@ class IntegrationTester:
                 }
             )
 
+            self._created_vector_ids.append(test_doc.id)
             success = await self.vector_service.upsert_documents([test_doc])
             self.log_test("Document Vectorization", success, "Successfully vectorized and stored document")
 
@@ -133,26 +226,26 @@ class IntegrationTester:
 
         try:
             # Test basic connection by querying health
-            response = self.supabase.table('innovations').select('id').limit(1).execute()
+            response = await _sb(lambda: self.supabase.table('innovations').select('id').limit(1).execute())
             self.log_test("Supabase Connection", True, "Successfully connected and queried innovations table")
 
             # Test metadata insertion
+            now = datetime.now().isoformat()
             test_innovation = {
+                **_INNOVATION_TEMPLATE,
                 "id": str(uuid4()),
                 "title": "Test AI Innovation for Integration",
                 "description": "This is a test innovation to verify Supabase integration works correctly",
                 "innovation_type": "TestTech",
-                "verification_status": "pending",
-                "visibility": "public",
-                "source_type": "integration_test",
                 "tags": ["test", "integration", "ai"],
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "created_at": now,
+                "updated_at": now
             }
 
             # Insert test innovation
-            insert_response = self.supabase.table('innovations').insert(test_innovation).execute()
-            insertion_success = len(insert_response.data) > 0
+            inserted_rows = await _sb(lambda: bulk_insert_innovations([test_innovation]))
+            insertion_success = len(inserted_rows) > 0
+            self._created_ids.extend(row['id'] for row in inserted_rows)
 
             self.log_test(
                 "Metadata Storage",
@@ -162,7 +255,7 @@ class IntegrationTester:
 
             # Test metadata retrieval
             if insertion_success:
-                retrieve_response = self.supabase.table('innovations').select('*').eq('id', test_innovation['id']).execute()
+                retrieve_response = await _sb(lambda: self.supabase.table('innovations').select('*').eq('id', test_innovation['id']).execute())
                 retrieval_success = len(retrieve_response.data) > 0
 
                 self.log_test(
@@ -171,10 +264,6 @@ class IntegrationTester:
                     f"Retrieved innovation: {retrieve_response.data[0]['title'] if retrieval_success else 'None'}"
                 )
 
-                # Cleanup test data
-                self.supabase.table('innovations').delete().eq('id', test_innovation['id']).execute()
-                self.log_test("Test Data Cleanup", True, "Removed test innovation from database")
-
             return True
 
         except Exception as e:
@@ -186,32 +275,10 @@ class IntegrationTester:
         print("\n📄 Testing Full-Text Vectorization...")
 
         try:
-            # Test different types of content
-            test_documents = [
-                {
-                    "title": "Mobile Health App for Rural Tanzania",
-                    "description": "A comprehensive mobile application that uses AI to provide healthcare diagnostics and treatment recommendations for rural communities in Tanzania. The app leverages machine learning algorithms trained on local health data to provide culturally appropriate medical advice.",
-                    "type": "HealthTech",
-                    "country": "Tanzania"
-                },
-                {
-                    "title": "Agricultural Yield Prediction System",
-                    "description": "Deep learning system that analyzes satellite imagery, weather patterns, and soil data to predict crop yields for smallholder farmers across West Africa. The system provides early warnings for potential crop failures and optimization recommendations.",
-                    "type": "AgriTech",
-                    "country": "Ghana"
-                },
-                {
-                    "title": "Financial Inclusion Platform",
-                    "description": "Blockchain-based microfinance platform that uses natural language processing to assess creditworthiness from alternative data sources including mobile money transactions and social media activity for unbanked populations in Kenya.",
-                    "type": "FinTech",
-                    "country": "Kenya"
-                }
-            ]
-
             # Vectorize each document
             vectorized_docs = []
-            for i, doc_data in enumerate(test_documents):
-                full_text = f"{doc_data['title']}. {doc_data['description']}"
+            for i, doc_data in enumerate(_FULL_TEXT_DOCUMENTS):
+                full_text = _full_text(doc_data)
 
                 vector_doc = VectorDocument(
                     id=f"fulltext_test_{i}_{uuid4()}",
@@ -229,6 +296,7 @@ class IntegrationTester:
 
             # Batch upsert all documents
             success = await self.vector_service.upsert_documents(vectorized_docs)
+            self._created_vector_ids.extend(doc.id for doc in vectorized_docs)
             self.log_test(
                 "Batch Full-Text Vectorization",
                 success,
@@ -236,21 +304,17 @@ class IntegrationTester:
             )
 
             # Test semantic search across all documents
-            search_queries = [
-                "healthcare mobile app Tanzania",
-                "crop prediction satellite imagery",
-                "microfinance blockchain Kenya",
-                "AI for agriculture West Africa"
-            ]
+            # Embed every query in one request (a no-op when prefetched); each search is then served from the cache
+            await self.vector_service.embed_texts(_FULL_TEXT_QUERIES)
 
             total_relevant_results = 0
-            for query in search_queries:
-                results = await service.search_similar(query)
+            for query in _FULL_TEXT_QUERIES:
+                results = await self.vector_service.search_similar(query)
                 # Count results from our test batch
-                relevant_results = [r for r in results if r.metadata.get("test_batch") == "full_text_vectorization"]
-                total_relevant_results += len(relevant_results)
+                relevant_count = Counter(r.metadata.get("test_batch") for r in results)["full_text_vectorization"]
+                total_relevant_results += relevant_count
 
-                print(f"    Query: '{query}' -> {len(relevant_results)} relevant results")
+                print(f"    Query: '{query}' -> {relevant_count} relevant results")
 
             self.log_test(
                 "Semantic Search Accuracy",
@@ -271,7 +335,9 @@ class IntegrationTester:
         try:
             # Simulate a complete innovation record
             innovation_id = uuid4()
+            now = datetime.now().isoformat()
             innovation_data = {
+                **_INNOVATION_TEMPLATE,
                 "id": str(innovation_id),
                 "title": "E2E Test: AI-Powered Education Platform",
                 "description": "An intelligent tutoring system that adapts to individual student learning patterns using reinforcement learning. The platform provides personalized educational content for students across multiple African languages and curricula, addressing the educational technology gap in underserved communities.",
@@ -282,16 +348,33 @@ class IntegrationTester:
                 "tech_stack": ["Python", "TensorFlow", "React", "Node.js"],
                 "tags": ["education", "ai", "adaptive-learning", "multilingual"],
                 "verification_status": "verified",
-                "visibility": "public",
-                "source_type": "integration_test",
                 "website_url": "https://example-edtech.com",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "created_at": now,
+                "updated_at": now
             }
 
-            # Step 1: Store metadata in Supabase
-            supabase_response = self.supabase.table('innovations').insert(innovation_data).execute()
-            metadata_stored = len(supabase_response.data) > 0
+            # Steps 1 and 2 write to independent backends, so the Supabase metadata insert
+            # and the Pinecone full-text vectorization run concurrently
+            full_content = f"{innovation_data['title']}. {innovation_data['description']}. Problem: {innovation_data['problem_solved']}. Solution: {innovation_data['solution_approach']}. Impact: {innovation_data['impact_metrics']}"
+
+            self._created_vector_ids.append(f"innovation_{innovation_id}")
+            stored_rows, vector_success = await asyncio.gather(
+                _sb(lambda: bulk_insert_innovations([innovation_data])),
+                self.vector_service.add_innovations_bulk([{
+                    "innovation_id": innovation_id,
+                    "title": innovation_data['title'],
+                    "description": full_content,
+                    "innovation_type": innovation_data['innovation_type'],
+                    "country": "Multi-country",
+                    "additional_metadata": {
+                        "tech_stack": innovation_data['tech_stack'],
+                        "website_url": innovation_data['website_url'],
+                        "test_type": "e2e_pipeline"
+                    }
+                }])
+            )
+            metadata_stored = len(stored_rows) > 0
+            self._created_ids.extend(row['id'] for row in stored_rows)
 
             self.log_test(
                 "E2E: Metadata Storage",
@@ -299,68 +382,43 @@ class IntegrationTester:
                 f"Stored innovation metadata in Supabase"
             )
 
-            # Step 2: Vectorize full text content for Pinecone
-            if metadata_stored:
-                full_content = f"{innovation_data['title']}. {innovation_data['description']}. Problem: {innovation_data['problem_solved']}. Solution: {innovation_data['solution_approach']}. Impact: {innovation_data['impact_metrics']}"
-
-                vector_success = await self.vector_service.add_innovation(
-                    innovation_id=innovation_id,
-                    title=innovation_data['title'],
-                    description=full_content,
-                    innovation_type=innovation_data['innovation_type'],
-                    country="Multi-country",
-                    additional_metadata={
-                        "tech_stack": innovation_data['tech_stack'],
-                        "website_url": innovation_data['website_url'],
-                        "test_type": "e2e_pipeline"
-                    }
-                )
-
-                self.log_test(
-                    "E2E: Vector Storage",
-                    vector_success,
-                    "Vectorized and stored full-text content in Pinecone"
-                )
-
-                # Step 3: Test retrieval and search
-                if vector_success:
-                    # Test metadata retrieval from Supabase
-                    metadata_query = self.supabase.table('innovations').select('*').eq('id', str(innovation_id)).execute()
-                    metadata_retrieved = len(metadata_query.data) > 0
+            self.log_test(
+                "E2E: Vector Storage",
+                vector_success,
+                "Vectorized and stored full-text content in Pinecone"
+            )
 
-                    # Test vector search in Pinecone
-                    vector_results = await self.vector_service.search_innovations(
+            # Step 3: Test retrieval and search from both backends at once
+            if metadata_stored and vector_success:
+                metadata_query, vector_results = await asyncio.gather(
+                    _sb(lambda: self.supabase.table('innovations').select('*').eq('id', str(innovation_id)).execute()),
+                    self.vector_service.search_innovations(
                         query="educational technology adaptive learning",
                         top_k=5
                     )
-                    vector_found = any(
-                        result.metadata.get("innovation_id") == str(innovation_id)
-                        for result in vector_results
-                    )
+                )
+                metadata_retrieved = len(metadata_query.data) > 0
+                # Index the hits once by innovation id for the membership and title checks
+                vector_titles = {r.metadata.get("innovation_id"): r.metadata.get("title") for r in vector_results}
+                vector_found = str(innovation_id) in vector_titles
 
-                    self.log_test(
-                        "E2E: Data Retrieval",
-                        metadata_retrieved and vector_found,
-                        f"Successfully retrieved from both Supabase and Pinecone"
-                    )
+                self.log_test(
+                    "E2E: Data Retrieval",
+                    metadata_retrieved and vector_found,
+                    f"Successfully retrieved from both Supabase and Pinecone"
+                )
 
-                    # Step 4: Test cross-referencing
-                    if metadata_retrieved and vector_found:
-                        supabase_title = metadata_query.data[0]['title']
-                        vector_title = next(
-                            (r.metadata.get('title') for r in vector_results
-                             if r.metadata.get("innovation_id") == str(innovation_id)), None)
+                # Step 4: Test cross-referencing
+                if metadata_retrieved and vector_found:
+                    supabase_title = metadata_query.data[0]['title']
+                    vector_title = vector_titles[str(innovation_id)]
 
-                        titles_match = supabase_title == vector_title
+                    titles_match = supabase_title == vector_title
                     self.log_test(
-                            "E2E: Data Consistency",
-                            titles_match,
-                            f"Data consistent across services: {supabase_title == vector_title}"
-                        )
-
-            # Cleanup
-            self.supabase.table('innovations').delete().eq('id', str(innovation_id)).execute()
-            await self.vector_service.delete_document(f"innovation_{innovation_id}")
+                        "E2E: Data Consistency",
+                        titles_match,
+                        f"Data consistent across services: {titles_match}"
+                    )
 
             return True
 
@@ -385,33 +443,16 @@ class IntegrationTester:
             value = getattr(settings, var_name, None)
             is_configured = value is not None and value != ""
 
-        self.log_test(
-        f"Config: {description}",
-        #     is_configured,
-        # "Configured" if is_configured else "Missing or empty"
-        # )
-
-        if not is_configured:
-            all_configured = False
-
-    if __name__ == "__main__":
-        tester = IntegrationTester()
-        asyncio.run(tester.initialize())
-            asyncio.run(tester.test_pinecone_connection())
-            asyncio.run(tester.test_supabase_connection())
-            asyncio.run(tester.test_full_text_vectorization())
-            asyncio.run(tester.test_end_to_end_pipeline())
-            asyncio.run(tester.test_environment_configuration())
-        print("All tests completed.")
-    # embedding_dimension = settings.EMBEDDING_DIMENSION
-
-    # self.log_test(
-    "Embedding Model Config",
-    bool(embedding_model and embedding_dimension > 0),
-    f"Model: {embedding_model}, Dimension: {embedding_dimension}"
-    # )
-
-        # return all_configured
+            self.log_test(
+                f"Config: {description}",
+                is_configured,
+                "Configured" if is_configured else "Missing or empty"
+            )
+
+            if not is_configured:
+                all_configured = False
+
+        return all_configured
 
     def print_summary(self):
         """Print test summary"""
@@ -419,8 +460,8 @@ class IntegrationTester:
         print("📋 INTEGRATION TEST SUMMARY")
         print("="*60)
 
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result["passed"])
+        total_tests = self.total_tests
+        passed_tests = self.passed_tests
         failed_tests = total_tests - passed_tests
 
         print(f"Total Tests: {total_tests}")
@@ -428,11 +469,15 @@ class IntegrationTester:
         print(f"❌ Failed: {failed_tests}")
         print(f"Success Rate: {(passed_tests / total_tests * 100):.1f}%")
 
+        if self.vector_service:
+            cache_info = self.vector_service.embedding_cache_info()
+            print(f"Embedding Cache: {cache_info['hits']} hits, {cache_info['misses']} misses "
+                  f"({cache_info['hit_rate'] * 100:.1f}% hit rate)")
+
         if failed_tests > 0:
             print("\n❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result["passed"]:
-                    print(f"  - {result['test']}: {result['details']}")
+            for result in self.failed_results:
+                print(f"  - {result['test']}: {result['details']}")
 
         print("\n🎯 INTEGRATION STATUS:")
         if failed_tests == 0:
@@ -458,19 +503,31 @@ async def main():
 
         # Run all tests
         await tester.test_environment_configuration()
-        await tester.test_pinecone_connection()
-        await tester.test_supabase_connection()
+        # Pinecone and Supabase checks share no data, so they run side by side while the
+        # next stage's embeddings are prefetched into the vector service cache
+        prefetch = asyncio.create_task(tester.prefetch_full_text_embeddings())
+        await asyncio.gather(
+            tester.test_pinecone_connection(),
+            tester.test_supabase_connection()
+        )
+        await prefetch
         await tester.test_full_text_vectorization()
         await tester.test_end_to_end_pipeline()
 
         # Print summary
         success = tester.print_summary()
 
-        # Save detailed results
-        with open('integration_test_results.json', 'w') as f:
-            json.dump(tester.test_results, f, indent=2)
+        # Detailed results were streamed while the tests ran; save a compact summary beside them
+        with open(RESULTS_SUMMARY_PATH, 'w') as f:
+            json.dump({
+                "total_tests": tester.total_tests,
+                "passed": tester.passed_tests,
+                "failed": tester.total_tests - tester.passed_tests,
+                "failed_tests": tester.failed_results,
+                "results_log": RESULTS_LOG_PATH
+            }, f)
 
-        print(f"\n📁 Detailed results saved to: integration_test_results.json")
+        print(f"\n📁 Detailed results saved to: {RESULTS_LOG_PATH} (summary: {RESULTS_SUMMARY_PATH})")
 
         return 0 if success else 1
 
@@ -481,8 +538,10 @@ async def main():
 
     finally:
         # Cleanup
-        if tester.db_session:
-            tester.db_session.close()
+        try:
+            await tester.teardown()
+        finally:
+            await tester.close()
 
 
 if __name__ == "__main__":
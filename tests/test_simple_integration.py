@@ -13,76 +13,233 @@ Usage:
 """
 
 import asyncio
+import bisect
+import functools
 import os
+import random
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any, Dict, List
+from uuid import UUID
 import json
 
+import pytest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add backend directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import settings
-from config.database import get_supabase
-from pinecone import Pinecone
 
+# Shares the session event loop (tests/conftest.py) with the other integration scripts
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# The Pinecone SDK and config.database (which builds the Supabase client and SQLAlchemy engines on
+# import) load only when the check that needs them runs
+if TYPE_CHECKING:
+    from pinecone import Pinecone
+
+# Synthetic vectors written, read back and deleted by test_basic_operations
+PINECONE_TEST_BATCH_SIZE = 16
+
+# Worker threads for the blocking Supabase/Pinecone calls; the Pinecone connection pool is sized to match
+_BLOCKING_WORKERS = 8
+
+# Index status can change (e.g. while initializing), so the memoized description is refreshed after this
+_PINECONE_CACHE_TTL_SECONDS = 60
+_pinecone_indexes = {}
+
+@functools.lru_cache(maxsize=1)
+def _get_pinecone_client() -> "Pinecone":
+    from pinecone import Pinecone
+
+    # Supabase already shares one pooled HTTP/2 client (config.database); this is the Pinecone side
+    return Pinecone(api_key=settings.PINECONE_API_KEY, pool_threads=_BLOCKING_WORKERS)
+
+def _load_supabase():
+    from config.database import get_supabase
+
+    return get_supabase()
+
+def _get_pinecone(index_name: str):
+    """(client, index handle, description) for index_name, fetched once per TTL window"""
+    cached = _pinecone_indexes.get(index_name)
+    if cached and time.monotonic() - cached[0] < _PINECONE_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    client = _get_pinecone_client()
+    index_info = client.describe_index(index_name)
+    # Passing the host skips the SDK's own describe_index lookup
+    index = client.Index(
+        name=index_name,
+        host=index_info.host,
+        pool_threads=_BLOCKING_WORKERS,
+        connection_pool_maxsize=_BLOCKING_WORKERS
+    )
+    _pinecone_indexes[index_name] = (time.monotonic(), (client, index, index_info))
+    return client, index, index_info
+
+# The Supabase and Pinecone clients are synchronous; their calls run on this bounded pool
+_BLOCKING_EXECUTOR = ThreadPoolExecutor(max_workers=_BLOCKING_WORKERS, thread_name_prefix="integration-io")
+
+def _batch_uuids(count: int):
+    """count random (version 4) UUID strings drawn from a single os.urandom call"""
+    raw = os.urandom(16 * count)
+    return [str(UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)) for i in range(count)]
+
+def _run_blocking(call, *args, **kwargs):
+    """Run a blocking Supabase/Pinecone call on the shared executor so it can be awaited or gathered"""
+    return asyncio.wrap_future(_BLOCKING_EXECUTOR.submit(call, *args, **kwargs))
+
+def _dump_metric(record: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(record).decode()
+    return json.dumps(record)
+
+# Upper bounds (ms) of the per-operation latency histogram buckets; slower calls land in a final +Inf bucket
+_LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 10000)
+
+# Set while a stage runs concurrently with others, so its log lines print together when it ends
+_log_buffer: ContextVar = ContextVar("_log_buffer", default=None)
+
+class AsyncBenchmark:
+    """Time an async block with perf_counter and record it under a stage label"""
+
+    def __init__(self, label: str, tester: "SimpleIntegrationTester"):
+        self.label = label
+        self.tester = tester
+        self.t0 = 0.0
+
+    async def __aenter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self.t0
+        self.tester.stage_timings[self.label] = duration
+        self.tester.log(f"⏱️  {self.label}: {duration * 1000:.2f}ms")
+        return False
+
+@dataclass(slots=True)
 class SimpleIntegrationTester:
     """Simple integration tester to understand current setup"""
 
-    def __init__(self):
-        self.supabase = None
-        self.pinecone_client = None
-        self.pinecone_index = None
+    supabase: Any = None
+    pinecone_client: Any = None
+    pinecone_index: Any = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    latency_histograms: Dict[str, List[int]] = field(default_factory=dict)
+    # Output is collected here and written with one stdout call at each stage boundary
+    _log_buf: List[str] = field(default_factory=list)
+    # Shown in the configuration summary; fixed for the run, so masked once
+    _masked_supabase_url: str = field(init=False)
+    _masked_db_url: str = field(init=False)
+
+    def __post_init__(self):
+        self._masked_supabase_url = f"{settings.SUPABASE_URL[:50]}..."
+        self._masked_db_url = f"{settings.db_url.split('@', 1)[0]}@***"
+
+    def _emit(self, line: str):
+        buffer = _log_buffer.get()
+        (buffer if buffer is not None else self._log_buf).append(line)
+
+    def flush_log(self):
+        """Write all pending output lines in one call"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+            self._log_buf.clear()
 
     def log(self, message: str):
         """Log message with timestamp"""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        self._emit(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+
+    def log_metric(self, stage: str, **fields):
+        """Emit one NDJSON metric line so a harness can aggregate runs without parsing the log"""
+        self._emit(_dump_metric({"ts": time.time(), "stage": stage, **fields}))
+
+    async def _timed(self, operation: str, call, *args, **kwargs):
+        """Run a blocking call on the shared executor and bucket its latency under operation"""
+        started = time.perf_counter_ns()
+        try:
+            return await _run_blocking(call, *args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter_ns() - started) / 1e6
+            counts = self.latency_histograms.setdefault(operation, [0] * (len(_LATENCY_BUCKETS_MS) + 1))
+            counts[bisect.bisect_left(_LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def print_latency_histograms(self):
+        """Print the non-empty latency buckets of every timed operation"""
+        self.log("📶 LATENCY HISTOGRAMS:")
+        bounds = [f"≤{bound:g}ms" for bound in _LATENCY_BUCKETS_MS] + ["+Inf"]
+        for operation, counts in sorted(self.latency_histograms.items()):
+            buckets = "  ".join(f"{bound}:{count}" for bound, count in zip(bounds, counts) if count)
+            self.log(f"    - {operation:<30} n={sum(counts):<3} {buckets}")
+            self.log_metric('latency', operation=operation, buckets_ms=list(_LATENCY_BUCKETS_MS), counts=counts)
+
+    async def _run_stage(self, label: str, check):
+        """Run and time one check with its log output held back until it finishes"""
+        buffer = []
+        _log_buffer.set(buffer)
+        ok = False
+        try:
+            async with AsyncBenchmark(label, self):
+                ok = await check()
+            return ok
+        finally:
+            _log_buffer.set(None)
+            self._log_buf.extend(buffer)
+            duration = self.stage_timings.get(label)
+            self.log_metric(label, duration_ms=round(duration * 1000, 3) if duration is not None else None, ok=bool(ok))
+            self._log_buf.append("")
+            self.flush_log()
 
     async def check_supabase_schema(self):
         """Check what columns actually exist in the innovations table"""
         self.log("🔍 Checking Supabase database schema...")
 
         try:
-            # Initialize Supabase client
-            self.supabase = get_supabase()
+            # Initialize Supabase client; the first import of config.database runs off the event loop
+            self.supabase = await _run_blocking(_load_supabase)
             self.log("✅ Supabase client initialized")
 
-            # Try to get table info by querying with limit 0
-            response = self.supabase.table('innovations').select('*').limit(1).execute()
+            # Fetch the column metadata in one RPC (data/schemas/add_innovations_schema_function.sql)
+            # instead of sampling a row and probing with a test insert/delete
+            try:
+                response = await self._timed('supabase.schema_rpc', self.supabase.rpc('innovations_schema').execute)
+            except Exception as rpc_error:
+                # Function not deployed: a HEAD request with a planned count still proves the
+                # table is reachable, without reading or writing any rows
+                self.log(f"⚠️  innovations_schema() unavailable: {rpc_error}")
+                head_response = await self._timed(
+                    'supabase.head_count',
+                    self.supabase.table('innovations').select('*', count='planned', head=True).execute
+                )
+                self.log(f"✅ innovations table reachable (~{head_response.count} rows, planner estimate)")
+                return True
+            columns = response.data or []
 
-            if response.data:
-                # If we have data, show the columns
-                sample_record = response.data[0]
-                columns = list(sample_record.keys())
+            if columns:
                 self.log(f"📋 Found {len(columns)} columns in innovations table:")
-                for col in sorted(columns):
-                    self.log(f"    - {col}")
+                for col in sorted(columns, key=lambda c: c['column_name']):
+                    self.log(f"    - {col['column_name']} ({col['data_type']})")
+
+                # Columns an insert must supply
+                required = [
+                    col['column_name'] for col in columns
+                    if not col['is_nullable'] and not col['has_default']
+                ]
+                self.log(f"📝 Required on insert: {', '.join(sorted(required)) or 'none'}")
             else:
-                self.log("📭 No data in innovations table, but connection works")
-
-            # Try a simple insert with minimal data to see what's required
-            test_innovation = {
-                "id": str(uuid4()),
-                "title": "Test Innovation - Simple Integration",
-                "description": "Testing database schema",
-                "innovation_type": "TestTech",
-                "domain": "TestDomain",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
-
-            try:
-                insert_response = self.supabase.table('innovations').insert(test_innovation).execute()
-                if insert_response.data:
-                    self.log("✅ Basic insert successful")
-                    # Clean up immediately
-                    self.supabase.table('innovations').delete().eq('id', test_innovation['id']).execute()
-                    self.log("🧹 Test record cleaned up")
-                else:
-                    self.log("⚠️  Insert response empty")
-            except Exception as insert_error:
-                self.log(f"❌ Insert failed: {insert_error}")
-                # This tells us what columns are missing or wrong
+                self.log("📭 No columns reported for innovations table, but connection works")
 
             return True
 
@@ -96,54 +253,50 @@ class SimpleIntegrationTester:
 
         try:
             # Initialize Pinecone client
-            self.pinecone_client = Pinecone(api_key=settings.PINECONE_API_KEY)
+            self.pinecone_client = await _run_blocking(_get_pinecone_client)
+            from pinecone import NotFoundException
             self.log("✅ Pinecone client initialized")
 
-            # List available indexes
-            indexes = self.pinecone_client.list_indexes()
-            self.log(f"📋 Found {len(indexes)} Pinecone indexes:")
-            for idx in indexes:
-                self.log(f"    - {idx.name}")
-
-            # Check our specific index
-            if settings.PINECONE_INDEX_NAME in [idx.name for idx in indexes]:
-                self.log(f"✅ Found target index: {settings.PINECONE_INDEX_NAME}")
-
-                # Get index details
-                index_info = self.pinecone_client.describe_index(settings.PINECONE_INDEX_NAME)
-                self.log(f"📊 Index details:")
-                self.log(f"    - Status: {index_info.status}")
-                self.log(f"    - Dimension: {index_info.dimension}")
-                self.log(f"    - Metric: {index_info.metric}")
-                self.log(f"    - Spec: {index_info.spec}")
-
-                # Connect to the index
-                self.pinecone_index = self.pinecone_client.Index(settings.PINECONE_INDEX_NAME)
-
-                # Get index stats
-                stats = self.pinecone_index.describe_index_stats()
-                self.log(f"📈 Index stats:")
-                self.log(f"    - Total vectors: {stats.total_vector_count}")
-                self.log(f"    - Index fullness: {stats.index_fullness}")
-
-                # Check if this is an inference-enabled index
-                try:
-                    # Try a simple text-based query to see if inference is enabled
-                    test_query_response = self.pinecone_index.query(
-                        data="test query",  # Text-based query
-                        top_k=1,
-                        include_metadata=True
-                    )
-                    self.log("✅ Index supports text-based queries (inference enabled)")
-                    self.log(f"    - Query returned {len(test_query_response.matches)} matches")
-                except Exception as query_error:
-                    self.log(f"⚠️  Text-based query failed: {query_error}")
-                    self.log("    - Index may require vector inputs instead of text")
-
-            else:
+            # Describe the target index directly; the full index list is only fetched to explain a miss
+            try:
+                _, self.pinecone_index, index_info = await self._timed('pinecone.describe_index', _get_pinecone, settings.PINECONE_INDEX_NAME)
+            except NotFoundException:
                 self.log(f"❌ Target index '{settings.PINECONE_INDEX_NAME}' not found")
+                indexes = await self._timed('pinecone.list_indexes', self.pinecone_client.list_indexes)
+                self.log(f"📋 Found {len(indexes)} Pinecone indexes:")
+                for idx in indexes:
+                    self.log(f"    - {idx.name}")
                 return False
 
+            self.log(f"✅ Found target index: {settings.PINECONE_INDEX_NAME}")
+            self.log(f"📊 Index details:")
+            self.log(f"    - Status: {index_info.status}")
+            self.log(f"    - Dimension: {index_info.dimension}")
+            self.log(f"    - Metric: {index_info.metric}")
+            self.log(f"    - Spec: {index_info.spec}")
+
+            # Get index stats
+            stats = await self._timed('pinecone.describe_index_stats', self.pinecone_index.describe_index_stats)
+            self.log(f"📈 Index stats:")
+            self.log(f"    - Total vectors: {stats.total_vector_count}")
+            self.log(f"    - Index fullness: {stats.index_fullness}")
+
+            # Check if this is an inference-enabled index
+            try:
+                # Try a simple text-based query to see if inference is enabled
+                test_query_response = await self._timed(
+                    'pinecone.query',
+                    self.pinecone_index.query,
+                    data="test query",  # Text-based query
+                    top_k=1,
+                    include_metadata=True
+                )
+                self.log("✅ Index supports text-based queries (inference enabled)")
+                self.log(f"    - Query returned {len(test_query_response.matches)} matches")
+            except Exception as query_error:
+                self.log(f"⚠️  Text-based query failed: {query_error}")
+                self.log("    - Index may require vector inputs instead of text")
+
             return True
 
         except Exception as e:
@@ -159,8 +312,7 @@ class SimpleIntegrationTester:
             return False
 
         try:
-            # Test 1: Simple Supabase operation
-            test_id = str(uuid4())
+            test_id, *record_uuids = _batch_uuids(1 + PINECONE_TEST_BATCH_SIZE)
             basic_innovation = {
                 "id": test_id,
                 "title": "Integration Test Innovation",
@@ -169,55 +321,86 @@ class SimpleIntegrationTester:
                 "domain": "TestDomain"
             }
 
-            # Add only the fields we know exist
-            supabase_response = self.supabase.table('innovations').insert(basic_innovation).execute()
-
-            if supabase_response.data:
-                self.log("✅ Basic Supabase insert works")
-
-                # Test retrieval
-                get_response = self.supabase.table('innovations').select('*').eq('id', test_id).execute()
-                if get_response.data:
-                    self.log("✅ Basic Supabase retrieval works")
-                    retrieved_data = get_response.data[0]
-                    self.log(f"    - Retrieved: {retrieved_data.get('title', 'No title')}")
-
-                # Clean up
-                self.supabase.table('innovations').delete().eq('id', test_id).execute()
-                self.log("🧹 Supabase test data cleaned up")
-
-            # Test 2: Basic Pinecone operation (if it supports it)
-            try:
-                # Try to upsert a simple record
-                test_record = {
-                    "id": f"test_{uuid4()}",
+            # One batch of synthetic vectors: upsert, fetch and delete are a single
+            # round-trip each however many records the batch holds
+            dimension = _get_pinecone(settings.PINECONE_INDEX_NAME)[2].dimension
+            test_records = [
+                {
+                    "id": f"test_{record_uuid}",
+                    "values": [random.uniform(-1.0, 1.0) for _ in range(dimension)],
                     "metadata": {
-                        "title": "Test Record",
+                        "title": f"Test Record {i}",
                         "content": "This is a test record for integration testing",
                         "test": True
                     }
                 }
+                for i, record_uuid in enumerate(record_uuids)
+            ]
+            test_record_ids = [record["id"] for record in test_records]
+
+            # Supabase insert (only the fields we know exist) and Pinecone upsert go to different
+            # services, so their round-trips overlap
+            started = time.perf_counter()
+            insert_result, upsert_result = await asyncio.gather(
+                self._timed('supabase.insert', self.supabase.table('innovations').insert(basic_innovation).execute),
+                self._timed('pinecone.upsert', self.pinecone_index.upsert, vectors=test_records),
+                return_exceptions=True
+            )
+            self.log(f"    - Insert + upsert of {len(test_records)} vectors: {(time.perf_counter() - started) * 1000:.1f}ms")
+            supabase_inserted = not isinstance(insert_result, Exception) and bool(insert_result.data)
+            pinecone_upserted = not isinstance(upsert_result, Exception)
 
-                # Note: This might fail if we need vectors instead of text
-                self.pinecone_index.upsert(vectors=[test_record])
-                self.log("✅ Basic Pinecone upsert works")
-
-                # Try to query
-                query_response = self.pinecone_index.query(
-                    id=test_record["id"],
-                    top_k=1,
-                    include_metadata=True
-                )
-
-                if query_response.matches:
-                    self.log("✅ Basic Pinecone query works")
+            try:
+                # Test 1: Simple Supabase operation
+                if isinstance(insert_result, Exception):
+                    raise insert_result
 
-                # Clean up
-                self.pinecone_index.delete(ids=[test_record["id"]])
-                self.log("🧹 Pinecone test data cleaned up")
+                if supabase_inserted:
+                    self.log("✅ Basic Supabase insert works")
 
-            except Exception as pinecone_error:
-                self.log(f"⚠️  Pinecone operations need adjustment: {pinecone_error}")
+                    # Test retrieval
+                    get_response = await self._timed(
+                        'supabase.select',
+                        self.supabase.table('innovations').select('*').eq('id', test_id).execute
+                    )
+                    if get_response.data:
+                        self.log("✅ Basic Supabase retrieval works")
+                        retrieved_data = get_response.data[0]
+                        self.log(f"    - Retrieved: {retrieved_data.get('title', 'No title')}")
+
+                # Test 2: Basic Pinecone operation (if it supports it)
+                if pinecone_upserted:
+                    self.log("✅ Basic Pinecone upsert works")
+
+                    try:
+                        # Fetch by id is cheaper than a similarity query for read-back
+                        started = time.perf_counter()
+                        fetch_response = await self._timed('pinecone.fetch', self.pinecone_index.fetch, ids=test_record_ids)
+                        elapsed_ms = (time.perf_counter() - started) * 1000
+
+                        if len(fetch_response.vectors) == len(test_record_ids):
+                            self.log(f"✅ Basic Pinecone fetch works ({len(test_record_ids)} vectors in {elapsed_ms:.1f}ms)")
+                    except Exception as pinecone_error:
+                        self.log(f"⚠️  Pinecone operations need adjustment: {pinecone_error}")
+                else:
+                    self.log(f"⚠️  Pinecone operations need adjustment: {upsert_result}")
+
+            finally:
+                # Clean up both services together
+                cleanups = []
+                if supabase_inserted:
+                    cleanups.append(self._timed(
+                        'supabase.delete',
+                        self.supabase.table('innovations').delete().eq('id', test_id).execute
+                    ))
+                if pinecone_upserted:
+                    cleanups.append(self._timed('pinecone.delete', self.pinecone_index.delete, ids=test_record_ids))
+                if cleanups:
+                    await asyncio.gather(*cleanups, return_exceptions=True)
+                    if supabase_inserted:
+                        self.log("🧹 Supabase test data cleaned up")
+                    if pinecone_upserted:
+                        self.log("🧹 Pinecone test data cleaned up")
 
             return True
 
@@ -229,10 +412,9 @@ class SimpleIntegrationTester:
         """Print current configuration"""
         self.log("⚙️  Configuration Summary:")
         self.log(f"    - Pinecone Index: {settings.PINECONE_INDEX_NAME}")
-        self.log(f"    - Embedding Model: {settings.EMBEDDING_MODEL}")
-        self.log(f"    - Embedding Dimension: {settings.EMBEDDING_DIMENSION}")
-        self.log(f"    - Supabase URL: {settings.SUPABASE_URL[:50]}...")
-        self.log(f"    - Database URL: {settings.DATABASE_URL.split('@', 1)[0]}@***")
+        self.log(f"    - Integrated Embedding: {settings.PINECONE_INTEGRATED_EMBEDDING}")
+        self.log(f"    - Supabase URL: {self._masked_supabase_url}")
+        self.log(f"    - Database URL: {self._masked_db_url}")
 
     async def run_all_checks(self):
         """Run all integration checks"""
@@ -241,22 +423,33 @@ class SimpleIntegrationTester:
 
         self.print_configuration_summary()
         self.log("")
+        self.flush_log()
 
-        # Run checks
-        supabase_ok = await self.check_supabase_schema()
-        self.log("")
+        # Run checks: the schema and Pinecone checks are independent, only the
+        # operations test needs both services set up
+        supabase_ok, pinecone_ok = await asyncio.gather(
+            self._run_stage('supabase_schema', self.check_supabase_schema),
+            self._run_stage('pinecone_setup', self.check_pinecone_setup)
+        )
 
-        pinecone_ok = await self.check_pinecone_setup()
-        self.log("")
-
-        operations_ok = await self.test_basic_operations()
-        self.log("")
+        operations_ok = await self._run_stage('basic_operations', self.test_basic_operations)
 
         # Summary
-        self.log("📋 SUMMARY:")
-        self.log(f"    - Supabase: {'✅ OK' if supabase_ok else '❌ Issues'}")
-        self.log(f"    - Pinecone: {'✅ OK' if pinecone_ok else '❌ Issues'}")
-        self.log(f"    - Operations: {'✅ OK' if operations_ok else '❌ Issues'}")
+        self.log_metric(
+            'summary',
+            supabase=bool(supabase_ok),
+            pinecone=bool(pinecone_ok),
+            operations=bool(operations_ok),
+            total_ms=round(sum(self.stage_timings.values()) * 1000, 3)
+        )
+
+        self.log("⏱️  STAGE TIMINGS:")
+        total = sum(self.stage_timings.values())
+        for label, duration in self.stage_timings.items():
+            share = duration / total * 100 if total else 0
+            self.log(f"    - {label:<18} {duration * 1000:>10.2f}ms  {share:5.1f}%")
+
+        self.print_latency_histograms()
 
         if supabase_ok and pinecone_ok:
             self.log("🎉 Basic integration looks good!")
@@ -264,19 +457,18 @@ class SimpleIntegrationTester:
         else:
             self.log("🔧 Issues found that need attention")
 
+        self.flush_log()
         return supabase_ok and pinecone_ok
 
-async def main():
-    """Run the simple integration test"""
+@pytest.mark.integration
+async def test_simple_integration():
+    """Run the simple integration checks; each check reports its own connection failures"""
     tester = SimpleIntegrationTester()
 
     try:
-        success = await tester.run_all_checks()
-        return 0 if success else 1
-    except Exception as e:
-        print(f"💥 Test failed with error: {e}")
-        return 1
+        assert await tester.run_all_checks(), "integration checks failed - see the log above"
+    finally:
+        tester.flush_log()
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    exit(exit_code)
+    sys.exit(pytest.main([__file__, "-s", "-q", "-m", "integration"]))